@@ -4,8 +4,15 @@ Implements coordinator, data analyst, and report generator agents using Google G
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import contextvars
+import functools
+import json
+import multiprocessing
+import queue
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 import pandas as pd
 
 from google import genai
@@ -16,10 +23,67 @@ from tools import (
     DataIngestionTool, 
     StatisticalAnalysisTool, 
     VisualizationTool,
-    ReportGenerationTool
+    ReportGenerationTool,
+    render_correlation_heatmap,
+    render_distribution_plot
 )
-from memory import MemoryBank, InMemorySessionService, AnalysisSession
-from observability import observability
+from memory import MemoryBank, InMemorySessionService, AnalysisSession, AnalysisResult
+from observability import now_iso, observability
+from llm_cache import cached_generation, lookup_cached, alookup_cached, store_cached
+
+
+# Upper bound on insights kept from a single report
+MAX_INSIGHTS = 7
+
+# Number of most extreme correlations/outliers sent to the model in an analysis prompt
+TOP_K = 10
+
+# One response line: optional bullet markers, then the insight text (markdown headings are skipped)
+INSIGHT_RE = re.compile(r'^(?!\s*#)\s*[•\-*]*\s*(.+?)\s*$')
+
+# Insight used when the model response contains no usable bullets
+DEFAULT_INSIGHT = (
+    "Analysis completed successfully. Review the visualizations and "
+    "detailed statistics for more information."
+)
+
+# System instruction shared by all agents; only the name and role vary
+SYSTEM_INSTRUCTION_TEMPLATE = """You are {name}, a specialized AI agent for business intelligence.
+Your role: {role}
+
+You provide clear, actionable insights based on data analysis. Be specific, use numbers, 
+and explain your reasoning. When analyzing data, consider:
+- Trends and patterns
+- Outliers and anomalies
+- Correlations and relationships
+- Business implications
+"""
+
+# Fallback text returned when Gemini keeps rejecting requests due to quota limits
+RATE_LIMIT_MESSAGE = (
+    "Unable to generate AI insights due to API rate limits. "
+    "The statistical analysis and visualizations are still available. "
+    "Please review the detailed analysis section for numeric insights."
+)
+
+# Session id of the analysis run queueing batch prompts, so concurrent runs never flush each other's
+_BATCH_KEY = contextvars.ContextVar("batch_key", default=None)
+
+
+# Worker processes for figure rendering, created on first use
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used to render figures in parallel."""
+    global _render_pool
+    if _render_pool is None:
+        # Never fork this process: it already runs the logging, session flush and
+        # asyncio worker threads, and a lock copied while held would deadlock the child
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _render_pool = ProcessPoolExecutor(max_workers=Config.RENDER_WORKERS,
+                                           mp_context=multiprocessing.get_context(method))
+    return _render_pool
 
 
 class BIAgent:
@@ -38,12 +102,121 @@ class BIAgent:
         self.role = role
         self.model_name = model_name or Config.DEFAULT_MODEL
         
-        # Initialize Gemini client
-        self.client = genai.Client(api_key=Config.GOOGLE_API_KEY)
+        # Rendered once so every request sends byte-identical instruction text
+        self._system_instruction = SYSTEM_INSTRUCTION_TEMPLATE.format(name=name, role=role)
+        
+        # Shared Gemini client (one per process, reused by every agent)
+        self.client = BIAgent._get_client(Config.GOOGLE_API_KEY)
         
         # Observability
         self.observability = observability
+        
+        # Explicit context cache for the static system instruction (created on first use)
+        self._cached_content_name: Optional[str] = None
+        self._cache_attempted = False
+        
+        # Prompts waiting to be sent in a Gemini batch job (see CoordinatorAgent._flush_batch)
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_client(api_key: str) -> genai.Client:
+        """Get the process-wide Gemini client for the given API key."""
+        return genai.Client(api_key=api_key)
+    
+    @property
+    def aio(self):
+        """Async interface of the shared Gemini client."""
+        return self.client.aio
+    
+    def _build_system_instruction(self) -> str:
+        """Get the static system instruction for this agent."""
+        return self._system_instruction
+    
+    @staticmethod
+    def _build_contents(prompt: str, context: Optional[Dict[str, Any]] = None) -> Any:
+        """Build request contents, sending per-call context as part of the turn."""
+        if context:
+            return [f"Context: {context}", prompt]
+        return prompt
+    
+    def _get_cached_content(self) -> Optional[str]:
+        """
+        Get the name of the context cache holding this agent's system instruction.
+        
+        The cache is created once per agent. Instructions below the model's
+        minimum cacheable size are never submitted, and if Gemini refuses the
+        cache anyway the agent falls back to sending the instruction inline.
+        
+        Returns:
+            Cached content name or None if caching is unavailable
+        """
+        if self._cache_attempted or not Config.CONTEXT_CACHE_ENABLED:
+            return self._cached_content_name
+        
+        self._cache_attempted = True
+        # Rough token estimate (~4 characters per token) saves a create call that would be rejected
+        if len(self._build_system_instruction()) // 4 < Config.CONTEXT_CACHE_MIN_TOKENS:
+            return None
+        try:
+            cache = self.client.caches.create(
+                model=self.model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=self._build_system_instruction(),
+                    ttl=Config.CONTEXT_CACHE_TTL,
+                )
+            )
+            self._cached_content_name = cache.name
+        except Exception as e:
+            self.observability.emit("warning", "context_cache_unavailable", agent=self.name, error=str(e))
+        
+        return self._cached_content_name
+    
+    def _generation_config(self, cached_content: Optional[str]) -> types.GenerateContentConfig:
+        """Build the generation config, referencing the context cache when available."""
+        if cached_content:
+            return types.GenerateContentConfig(
+                cached_content=cached_content,
+                temperature=Config.TEMPERATURE,
+            )
+        return types.GenerateContentConfig(
+            system_instruction=self._build_system_instruction(),
+            temperature=Config.TEMPERATURE,
+        )
+    
+    def queue_prompt(self, prompt_id: str, prompt: str,
+                     context: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Queue a prompt for the next batch job instead of calling Gemini now.
+        
+        Args:
+            prompt_id: Identifier used to route the response back
+            prompt: User prompt
+            context: Additional context for the prompt
+        """
+        self.observability.log_agent_call(
+            agent_name=self.name,
+            task=prompt[:100],
+            model=self.model_name,
+            batched=True
+        )
+        request = {
+            "prompt_id": prompt_id,
+            "batch_key": _BATCH_KEY.get(),
+            "contents": self._build_contents(prompt, context),
+            "config": self._generation_config(None),
+        }
+        with self._pending_lock:
+            self._pending.append(request)
+    
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """Check whether a generation error was caused by API rate limiting."""
+        error_str = str(error)
+        return "429" in error_str or "RESOURCE_EXHAUSTED" in error_str or "quota" in error_str.lower()
     
+    @cached_generation
     def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a response using Gemini.
@@ -64,19 +237,9 @@ class BIAgent:
             model=self.model_name
         )
         
-        # Build system instruction
-        system_instruction = f"""You are {self.name}, a specialized AI agent for business intelligence.
-Your role: {self.role}
-
-You provide clear, actionable insights based on data analysis. Be specific, use numbers, 
-and explain your reasoning. When analyzing data, consider:
-- Trends and patterns
-- Outliers and anomalies
-- Correlations and relationships
-- Business implications
-
-{f'Context: {context}' if context else ''}
-"""
+        # Build request, reusing the cached system instruction when possible
+        contents = self._build_contents(prompt, context)
+        config = self._generation_config(self._get_cached_content())
         
         max_retries = 3
         retry_delay = 5
@@ -86,22 +249,18 @@ and explain your reasoning. When analyzing data, consider:
                 # Generate response
                 response = self.client.models.generate_content(
                     model=self.model_name,
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        system_instruction=system_instruction,
-                        temperature=Config.TEMPERATURE,
-                    )
+                    contents=contents,
+                    config=config
                 )
                 
                 return response.text
             
             except Exception as e:
-                error_str = str(e)
-                
                 # Check if it's a rate limit error
-                if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str or "quota" in error_str.lower():
+                if self._is_rate_limit_error(e):
                     if attempt < max_retries - 1:
-                        self.observability.logger.warning(
+                        self.observability.emit(
+                            "warning",
                             "rate_limit_hit",
                             attempt=attempt + 1,
                             retry_in=retry_delay,
@@ -112,11 +271,7 @@ and explain your reasoning. When analyzing data, consider:
                         continue
                     else:
                         # Max retries reached, return a friendly message
-                        return (
-                            "Unable to generate AI insights due to API rate limits. "
-                            "The statistical analysis and visualizations are still available. "
-                            "Please review the detailed analysis section for numeric insights."
-                        )
+                        return RATE_LIMIT_MESSAGE
                 else:
                     # Other error
                     self.observability.log_error(
@@ -127,6 +282,134 @@ and explain your reasoning. When analyzing data, consider:
                     return f"Error generating response: {str(e)}"
         
         return "Analysis completed. Unable to generate AI insights at this time."
+    
+    @cached_generation
+    async def agenerate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate a response using the async Gemini client.
+        
+        Mirrors generate_response but awaits the request so several agents
+        can overlap their network latency.
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the prompt
+            
+        Returns:
+            Generated response text
+        """
+        self.observability.log_agent_call(
+            agent_name=self.name,
+            task=prompt[:100],
+            model=self.model_name
+        )
+        
+        contents = self._build_contents(prompt, context)
+        config = self._generation_config(await asyncio.to_thread(self._get_cached_content))
+        
+        max_retries = 3
+        retry_delay = 5
+        
+        for attempt in range(max_retries):
+            try:
+                response = await self.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=config
+                )
+                
+                return response.text
+            
+            except Exception as e:
+                if self._is_rate_limit_error(e):
+                    if attempt < max_retries - 1:
+                        self.observability.emit(
+                            "warning",
+                            "rate_limit_hit",
+                            attempt=attempt + 1,
+                            retry_in=retry_delay,
+                            agent=self.name
+                        )
+                        await asyncio.sleep(retry_delay)
+                        retry_delay *= 2  # Exponential backoff
+                        continue
+                    else:
+                        return RATE_LIMIT_MESSAGE
+                else:
+                    self.observability.log_error(
+                        error_type="generation_error",
+                        message=str(e),
+                        agent=self.name
+                    )
+                    return f"Error generating response: {str(e)}"
+        
+        return "Analysis completed. Unable to generate AI insights at this time."
+
+
+    def stream_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Stream a response from Gemini chunk by chunk.
+        
+        Closing the generator early closes the underlying stream, so the
+        model stops spending output tokens.
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the prompt
+            
+        Yields:
+            Text chunks as they arrive
+        """
+        self.observability.log_agent_call(
+            agent_name=self.name,
+            task=prompt[:100],
+            model=self.model_name,
+            streaming=True
+        )
+        
+        stream = self.client.models.generate_content_stream(
+            model=self.model_name,
+            contents=self._build_contents(prompt, context),
+            config=self._generation_config(self._get_cached_content())
+        )
+        try:
+            for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            stream.close()
+    
+    async def astream_response(self, prompt: str,
+                               context: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Async version of stream_response.
+        
+        Args:
+            prompt: User prompt
+            context: Additional context for the prompt
+            
+        Yields:
+            Text chunks as they arrive
+        """
+        self.observability.log_agent_call(
+            agent_name=self.name,
+            task=prompt[:100],
+            model=self.model_name,
+            streaming=True
+        )
+        
+        config = self._generation_config(await asyncio.to_thread(self._get_cached_content))
+        stream = await self.aio.models.generate_content_stream(
+            model=self.model_name,
+            contents=self._build_contents(prompt, context),
+            config=config
+        )
+        try:
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            await stream.aclose()
 
 
 class DataAnalystAgent(BIAgent):
@@ -143,38 +426,46 @@ class DataAnalystAgent(BIAgent):
         )
         self.stats_tool = StatisticalAnalysisTool()
     
-    def analyze_dataset(self, df: pd.DataFrame, data_summary: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_statistics(self, df: pd.DataFrame,
+                        numeric_cols: Optional[pd.Index] = None) -> AnalysisResult:
         """
-        Perform comprehensive analysis on a dataset.
+        Run the statistical part of the dataset analysis.
         
         Args:
             df: DataFrame to analyze
-            data_summary: Summary of the dataset
+            numeric_cols: Numeric columns of df, if already computed by the caller
             
         Returns:
-            Dictionary containing analysis results
+            AnalysisResult with correlation and outlier analysis (no AI insights yet)
         """
-        results = {
-            "timestamp": datetime.now().isoformat(),
-            "correlation_analysis": {},
-            "outlier_analysis": {},
-            "ai_insights": ""
-        }
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=['number']).columns
         
         # Perform correlation analysis
-        results["correlation_analysis"] = self.stats_tool.calculate_correlations(df)
+        correlation_analysis = self.stats_tool.calculate_correlations(df, list(numeric_cols))
         
         # Detect outliers in numeric columns
-        numeric_cols = df.select_dtypes(include=['number']).columns
-        outliers_found = []
-        for col in numeric_cols[:5]:  # Limit to first 5 numeric columns
-            outlier_info = self.stats_tool.detect_outliers(df, col)
-            if outlier_info.get("outlier_percentage", 0) > 5:  # Only report if > 5% outliers
-                outliers_found.append(outlier_info)
-        results["outlier_analysis"] = outliers_found
+        outliers_found = [
+            outlier_info
+            for outlier_info in self.stats_tool.detect_outliers_vectorized(df, list(numeric_cols[:5]))  # First 5 numeric columns
+            if outlier_info["outlier_percentage"] > 5  # Only report if > 5% outliers
+        ]
         
-        # Generate AI insights
-        analysis_prompt = f"""Analyze this dataset and provide key insights:
+        return AnalysisResult(
+            timestamp=now_iso(),
+            correlation_analysis=correlation_analysis,
+            outlier_analysis=outliers_found,
+            ai_insights=""
+        )
+    
+    def _build_analysis_prompt(self, data_summary: Dict[str, Any], results: AnalysisResult) -> str:
+        """Build the AI insights prompt for a dataset analysis."""
+        # The full lists stay in results for the report; the model only sees the top entries
+        strong = results.correlation_analysis.get('strong_correlations', [])
+        top_corr = sorted(strong, key=lambda c: -abs(c['correlation']))[:TOP_K]
+        top_out = sorted(results.outlier_analysis, key=lambda o: -o['outlier_percentage'])[:TOP_K]
+        
+        return f"""Analyze this dataset and provide key insights:
 
 Dataset Summary:
 - Rows: {data_summary['shape']['rows']}
@@ -182,11 +473,11 @@ Dataset Summary:
 - Column names: {', '.join(data_summary['columns'])}
 
 Correlation Analysis:
-Strong correlations found: {len(results['correlation_analysis'].get('strong_correlations', []))}
-{results['correlation_analysis'].get('strong_correlations', [])}
+Strong correlations found: {len(strong)} (top {len(top_corr)} by magnitude)
+{json.dumps(top_corr, separators=(',', ':'))}
 
-Outliers Detected:
-{outliers_found}
+Outliers Detected: {len(results.outlier_analysis)} columns (top {len(top_out)} by percentage)
+{json.dumps(top_out, separators=(',', ':'))}
 
 Provide 3-5 key insights about this data, including:
 1. Overall data quality and completeness
@@ -194,28 +485,71 @@ Provide 3-5 key insights about this data, including:
 3. Potential data issues or anomalies
 4. Recommendations for further analysis
 """
+    
+    def analyze_dataset(self, df: pd.DataFrame, data_summary: Dict[str, Any],
+                        numeric_cols: Optional[pd.Index] = None) -> AnalysisResult:
+        """
+        Perform comprehensive analysis on a dataset.
         
-        results["ai_insights"] = self.generate_response(analysis_prompt)
+        Args:
+            df: DataFrame to analyze
+            data_summary: Summary of the dataset
+            numeric_cols: Numeric columns of df, if already computed by the caller
+            
+        Returns:
+            AnalysisResult containing the analysis
+        """
+        results = self._run_statistics(df, numeric_cols)
+        
+        # Generate AI insights
+        analysis_prompt = self._build_analysis_prompt(data_summary, results)
+        results.ai_insights = self.generate_response(analysis_prompt)
         
         return results
     
-    def analyze_time_series(self, df: pd.DataFrame, date_column: str, 
-                           value_column: str) -> Dict[str, Any]:
+    def queue_dataset_analysis(self, df: pd.DataFrame, data_summary: Dict[str, Any],
+                               numeric_cols: Optional[pd.Index] = None) -> AnalysisResult:
         """
-        Analyze time series data.
+        Run the statistics now and queue the AI insights prompt for batch mode.
         
         Args:
-            df: DataFrame with time series data
-            date_column: Name of date column
-            value_column: Name of value column
+            df: DataFrame to analyze
+            data_summary: Summary of the dataset
+            numeric_cols: Numeric columns of df, if already computed by the caller
             
         Returns:
-            Time series analysis results
+            AnalysisResult; ai_insights is filled in once the batch is flushed
         """
-        trend_results = self.stats_tool.trend_analysis(df, date_column, value_column)
+        results = self._run_statistics(df, numeric_cols)
+        self.queue_prompt("dataset_analysis", self._build_analysis_prompt(data_summary, results))
+        return results
+    
+    async def aanalyze_dataset(self, df: pd.DataFrame, data_summary: Dict[str, Any],
+                               numeric_cols: Optional[pd.Index] = None) -> AnalysisResult:
+        """
+        Async version of analyze_dataset.
         
-        # Generate AI insights on trends
-        trend_prompt = f"""Analyze this time series trend:
+        Statistics run in a worker thread and the Gemini call is awaited, so
+        other agents can make progress in the meantime.
+        
+        Args:
+            df: DataFrame to analyze
+            data_summary: Summary of the dataset
+            numeric_cols: Numeric columns of df, if already computed by the caller
+            
+        Returns:
+            AnalysisResult containing the analysis
+        """
+        results = await asyncio.to_thread(self._run_statistics, df, numeric_cols)
+        
+        analysis_prompt = self._build_analysis_prompt(data_summary, results)
+        results.ai_insights = await self.agenerate_response(analysis_prompt)
+        
+        return results
+    
+    def _build_trend_prompt(self, value_column: str, trend_results: Dict[str, Any]) -> str:
+        """Build the AI insights prompt for a time series trend."""
+        return f"""Analyze this time series trend:
 
 Metric: {value_column}
 Trend Direction: {trend_results.get('trend_direction', 'unknown')}
@@ -233,10 +567,45 @@ Provide insights on:
 2. Business implications
 3. Potential forecasting considerations
 """
+    
+    def analyze_time_series(self, df: pd.DataFrame, date_column: str, 
+                           value_column: str) -> Dict[str, Any]:
+        """
+        Analyze time series data.
+        
+        Args:
+            df: DataFrame with time series data
+            date_column: Name of date column
+            value_column: Name of value column
+            
+        Returns:
+            Time series analysis results
+        """
+        trend_results = self.stats_tool.trend_analysis(df, date_column, value_column)
+        
+        # Generate AI insights on trends
+        trend_prompt = self._build_trend_prompt(value_column, trend_results)
         
         trend_results["ai_insights"] = self.generate_response(trend_prompt)
         
         return trend_results
+    
+    def queue_time_series_analysis(self, df: pd.DataFrame, date_column: str,
+                                   value_column: str) -> Dict[str, Any]:
+        """
+        Run the trend analysis now and queue the AI insights prompt for batch mode.
+        
+        Args:
+            df: DataFrame with time series data
+            date_column: Name of date column
+            value_column: Name of value column
+            
+        Returns:
+            Trend results; "ai_insights" is filled in once the batch is flushed
+        """
+        trend_results = self.stats_tool.trend_analysis(df, date_column, value_column)
+        self.queue_prompt("time_series_analysis", self._build_trend_prompt(value_column, trend_results))
+        return trend_results
 
 
 class VisualizationAgent(BIAgent):
@@ -254,13 +623,15 @@ class VisualizationAgent(BIAgent):
         self.viz_tool = VisualizationTool()
     
     def create_visualizations(self, df: pd.DataFrame, 
-                            analysis_results: Dict[str, Any]) -> List[str]:
+                            analysis_results: Dict[str, Any],
+                            numeric_cols: Optional[pd.Index] = None) -> List[str]:
         """
         Create appropriate visualizations for the dataset.
         
         Args:
             df: DataFrame to visualize
             analysis_results: Results from data analysis
+            numeric_cols: Numeric columns of df, if already computed by the caller
             
         Returns:
             List of paths to created visualizations
@@ -269,23 +640,75 @@ class VisualizationAgent(BIAgent):
         
         try:
             # Create correlation heatmap if we have numeric columns
-            numeric_cols = df.select_dtypes(include=['number']).columns
+            if numeric_cols is None:
+                numeric_cols = df.select_dtypes(include=['number']).columns
+            jobs = []
             if len(numeric_cols) > 1:
-                viz_path = self.viz_tool.create_correlation_heatmap(df)
-                visualizations.append(viz_path)
-                self.observability.logger.info("created_visualization", type="correlation_heatmap", path=viz_path)
+                jobs.append(("correlation_heatmap", None, df[numeric_cols]))
             
             # Create distribution plots for key numeric columns
             for col in numeric_cols[:3]:  # First 3 numeric columns
-                viz_path = self.viz_tool.create_distribution_plot(df, col)
+                jobs.append(("distribution", col, df[[col]]))
+            
+            if self._use_render_pool(df, jobs):
+                # Each figure renders on its own core; workers only receive the columns they plot
+                pool = _get_render_pool()
+                futures = [
+                    pool.submit(render_correlation_heatmap, frame) if kind == "correlation_heatmap"
+                    else pool.submit(render_distribution_plot, frame, col)
+                    for kind, col, frame in jobs
+                ]
+                results = (future.result() for future in futures)
+            else:
+                results = (
+                    self.viz_tool.create_correlation_heatmap(frame) if kind == "correlation_heatmap"
+                    else self.viz_tool.create_distribution_plot(frame, col)
+                    for kind, col, frame in jobs
+                )
+            
+            for (kind, col, _), viz_path in zip(jobs, results):
                 visualizations.append(viz_path)
-                self.observability.logger.info("created_visualization", type="distribution", column=col, path=viz_path)
+                if col is None:
+                    self.observability.emit("info", "created_visualization", type=kind, path=viz_path)
+                else:
+                    self.observability.emit("info", "created_visualization", type=kind, column=col, path=viz_path)
         
         except Exception as e:
             self.observability.log_error("visualization_error", str(e))
         
         return visualizations
     
+    @staticmethod
+    def _use_render_pool(df: pd.DataFrame, jobs: List[Any]) -> bool:
+        """
+        Decide whether figures should be rendered in worker processes.
+        
+        Workers start from a fresh interpreter (forkserver or spawn) and import
+        the scientific stack themselves, which only pays off for large frames.
+        """
+        if not Config.PARALLEL_RENDERING or len(jobs) < 2:
+            return False
+        return len(df) >= Config.PARALLEL_RENDER_MIN_ROWS
+    
+    async def acreate_visualizations(self, df: pd.DataFrame,
+                                     analysis_results: Dict[str, Any],
+                                     numeric_cols: Optional[pd.Index] = None) -> List[str]:
+        """
+        Async version of create_visualizations.
+        
+        Rendering is CPU-bound, so it runs in a worker thread while the
+        event loop keeps serving the other agents' Gemini calls.
+        
+        Args:
+            df: DataFrame to visualize
+            analysis_results: Results from data analysis
+            numeric_cols: Numeric columns of df, if already computed by the caller
+            
+        Returns:
+            List of paths to created visualizations
+        """
+        return await asyncio.to_thread(self.create_visualizations, df, analysis_results, numeric_cols)
+    
     def create_time_series_viz(self, df: pd.DataFrame, date_column: str, 
                                value_column: str) -> Optional[str]:
         """
@@ -301,7 +724,7 @@ class VisualizationAgent(BIAgent):
         """
         try:
             viz_path = self.viz_tool.create_time_series_plot(df, date_column, value_column)
-            self.observability.logger.info("created_visualization", type="time_series", path=viz_path)
+            self.observability.emit("info", "created_visualization", type="time_series", path=viz_path)
             return viz_path
         except Exception as e:
             self.observability.log_error("visualization_error", str(e))
@@ -322,21 +745,11 @@ class ReportGeneratorAgent(BIAgent):
         )
         self.report_tool = ReportGenerationTool()
     
-    def generate_insights(self, data_summary: Dict[str, Any], 
-                         analysis_results: Dict[str, Any],
-                         session_context: Optional[Dict[str, Any]] = None) -> List[str]:
-        """
-        Generate key insights from analysis results.
-        
-        Args:
-            data_summary: Dataset summary
-            analysis_results: Analysis results
-            session_context: Context from previous sessions
-            
-        Returns:
-            List of key insights
-        """
-        insights_prompt = f"""Based on the following analysis, generate 5-7 key business insights 
+    def _build_insights_prompt(self, data_summary: Dict[str, Any],
+                               analysis_results: Dict[str, Any],
+                               session_context: Optional[Dict[str, Any]] = None) -> str:
+        """Build the prompt used to synthesize business insights."""
+        return f"""Based on the following analysis, generate 5-7 key business insights 
 that would be valuable to stakeholders:
 
 Dataset: {data_summary['shape']['rows']} rows, {data_summary['shape']['columns']} columns
@@ -353,30 +766,213 @@ Provide insights that are:
 4. Clear - easy to understand
 
 Format each insight as a complete sentence starting with a bullet point."""
+    
+    @staticmethod
+    def _parse_insight_line(line: str) -> Optional[str]:
+        """Turn one response line into an insight, or None if it is not one."""
+        match = INSIGHT_RE.match(line)
+        if match is None:
+            return None
+        insight = match.group(1)
+        return insight if len(insight) > 10 else None
+    
+    def _parse_insights(self, response: Any) -> List[str]:
+        """
+        Parse a Gemini response into a list of insights.
         
-        response = self.generate_response(insights_prompt)
-        
+        Args:
+            response: Raw response returned by the model
+            
+        Returns:
+            List of at most 7 insights
+        """
         # Ensure response is a string
         if not isinstance(response, str):
             response = str(response)
         
         # Parse insights from response
         try:
-            insights = [line.strip().lstrip('•-*').strip() 
-                       for line in response.split('\n') 
-                       if line.strip() and not line.strip().startswith('#')]
-            
-            # Filter out empty insights
-            insights = [i for i in insights if len(i) > 10]
+            insights = [insight for insight in map(self._parse_insight_line, response.split('\n'))
+                        if insight]
             
             # If no insights extracted, create a default one
             if not insights:
-                insights = ["Analysis completed successfully. Review the visualizations and detailed statistics for more information."]
+                insights = [DEFAULT_INSIGHT]
         except Exception as e:
             self.observability.log_error("insight_parsing_error", str(e))
             insights = ["Analysis completed. Unable to generate detailed insights at this time."]
         
-        return insights[:7]  # Limit to 7 insights
+        return insights[:MAX_INSIGHTS]
+    
+    def iter_insights(self, data_summary: Dict[str, Any],
+                      analysis_results: Dict[str, Any],
+                      session_context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Yield insights as soon as each bullet arrives from the model.
+        
+        The stream is closed once 7 insights have been collected. If streaming
+        fails before any insight arrives, falls back to generate_response.
+        
+        Args:
+            data_summary: Dataset summary
+            analysis_results: Analysis results
+            session_context: Context from previous sessions
+            
+        Yields:
+            Key insights, at most 7
+        """
+        prompt = self._build_insights_prompt(data_summary, analysis_results, session_context)
+        
+        cached, embedding = lookup_cached(self, prompt)
+        if cached is not None:
+            yield from self._parse_insights(cached)
+            return
+        
+        received = []
+        count = 0
+        try:
+            chunks = self.stream_response(prompt)
+            try:
+                buffer = ""
+                for chunk in chunks:
+                    received.append(chunk)
+                    buffer += chunk
+                    while '\n' in buffer and count < MAX_INSIGHTS:
+                        line, buffer = buffer.split('\n', 1)
+                        insight = self._parse_insight_line(line)
+                        if insight:
+                            count += 1
+                            yield insight
+                    if count >= MAX_INSIGHTS:
+                        break
+                else:
+                    insight = self._parse_insight_line(buffer)
+                    if insight and count < MAX_INSIGHTS:
+                        count += 1
+                        yield insight
+            finally:
+                chunks.close()
+        except Exception as e:
+            self.observability.log_error("insight_stream_error", str(e), agent=self.name)
+            if count == 0:
+                yield from self._parse_insights(self.generate_response(prompt))
+            # A stream cut off partway is never cached, so the next run asks again
+            return
+        
+        if count == 0:
+            yield DEFAULT_INSIGHT
+        else:
+            store_cached(self, prompt, None, "".join(received), embedding)
+    
+    async def aiter_insights(self, data_summary: Dict[str, Any],
+                             analysis_results: Dict[str, Any],
+                             session_context: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        Async version of iter_insights.
+        
+        Args:
+            data_summary: Dataset summary
+            analysis_results: Analysis results
+            session_context: Context from previous sessions
+            
+        Yields:
+            Key insights, at most 7
+        """
+        prompt = self._build_insights_prompt(data_summary, analysis_results, session_context)
+        
+        cached, embedding = await alookup_cached(self, prompt)
+        if cached is not None:
+            for insight in self._parse_insights(cached):
+                yield insight
+            return
+        
+        received = []
+        count = 0
+        try:
+            chunks = self.astream_response(prompt)
+            try:
+                buffer = ""
+                async for chunk in chunks:
+                    received.append(chunk)
+                    buffer += chunk
+                    while '\n' in buffer and count < MAX_INSIGHTS:
+                        line, buffer = buffer.split('\n', 1)
+                        insight = self._parse_insight_line(line)
+                        if insight:
+                            count += 1
+                            yield insight
+                    if count >= MAX_INSIGHTS:
+                        break
+                else:
+                    insight = self._parse_insight_line(buffer)
+                    if insight and count < MAX_INSIGHTS:
+                        count += 1
+                        yield insight
+            finally:
+                await chunks.aclose()
+        except Exception as e:
+            self.observability.log_error("insight_stream_error", str(e), agent=self.name)
+            if count == 0:
+                for insight in self._parse_insights(await self.agenerate_response(prompt)):
+                    yield insight
+            # A stream cut off partway is never cached, so the next run asks again
+            return
+        
+        if count == 0:
+            yield DEFAULT_INSIGHT
+        else:
+            store_cached(self, prompt, None, "".join(received), embedding)
+    
+    def generate_insights(self, data_summary: Dict[str, Any], 
+                         analysis_results: Dict[str, Any],
+                         session_context: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Generate key insights from analysis results.
+        
+        Args:
+            data_summary: Dataset summary
+            analysis_results: Analysis results
+            session_context: Context from previous sessions
+            
+        Returns:
+            List of key insights
+        """
+        return list(self.iter_insights(data_summary, analysis_results, session_context))
+    
+    def queue_insights(self, data_summary: Dict[str, Any],
+                       analysis_results: Dict[str, Any],
+                       session_context: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Queue the insights prompt for batch mode.
+        
+        The raw response is turned into insights with _parse_insights after
+        the batch is flushed.
+        
+        Args:
+            data_summary: Dataset summary
+            analysis_results: Analysis results
+            session_context: Context from previous sessions
+        """
+        self.queue_prompt(
+            "insights",
+            self._build_insights_prompt(data_summary, analysis_results, session_context)
+        )
+    
+    async def agenerate_insights(self, data_summary: Dict[str, Any],
+                                 analysis_results: Dict[str, Any],
+                                 session_context: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Async version of generate_insights.
+        
+        Args:
+            data_summary: Dataset summary
+            analysis_results: Analysis results
+            session_context: Context from previous sessions
+            
+        Returns:
+            List of key insights
+        """
+        return [insight async for insight in self.aiter_insights(data_summary, analysis_results, session_context)]
     
     def generate_report(self, data_summary: Dict[str, Any],
                        analysis_results: Dict[str, Any],
@@ -401,7 +997,7 @@ Format each insight as a complete sentence starting with a bullet point."""
             insights=insights
         )
         
-        self.observability.logger.info("report_generated", path=report_path)
+        self.observability.emit("info", "report_generated", path=report_path)
         
         return report_path
 
@@ -424,10 +1020,7 @@ class CoordinatorAgent(BIAgent):
             role="Orchestrates the BI analysis workflow and coordinates specialist agents"
         )
         
-        # Initialize specialist agents
-        self.data_analyst = DataAnalystAgent()
-        self.visualizer = VisualizationAgent()
-        self.report_generator = ReportGeneratorAgent()
+        # Specialist agents are created on first use (see the cached properties below)
         
         # Initialize tools
         self.ingestion_tool = DataIngestionTool()
@@ -436,26 +1029,188 @@ class CoordinatorAgent(BIAgent):
         self.memory_bank = memory_bank
         self.session_service = InMemorySessionService(memory_bank)
     
-    def analyze_file(self, file_path: str, analysis_type: str = "comprehensive") -> Dict[str, Any]:
+    @functools.cached_property
+    def data_analyst(self) -> DataAnalystAgent:
+        """Data Analyst agent, created on first use."""
+        return DataAnalystAgent()
+    
+    @functools.cached_property
+    def visualizer(self) -> VisualizationAgent:
+        """Visualization agent, created on first use."""
+        return VisualizationAgent()
+    
+    @functools.cached_property
+    def report_generator(self) -> ReportGeneratorAgent:
+        """Report Generator agent, created on first use."""
+        return ReportGeneratorAgent()
+    
+    def _flush_batch(self) -> Dict[str, str]:
+        """
+        Send every queued specialist prompt as one Gemini batch job.
+        
+        Polls the job until it finishes and routes each response back by
+        prompt_id. Prompts that fail get the standard fallback message.
+        
+        Returns:
+            Mapping of prompt_id to response text
+        """
+        import time
+        
+        # Only look at specialists that already exist; touching the properties would create them
+        agents = [self.__dict__[name] for name in ("data_analyst", "visualizer", "report_generator")
+                  if name in self.__dict__]
+        # Take only this run's prompts; concurrent runs on the same coordinator queue under their own key
+        batch_key = _BATCH_KEY.get()
+        pending = []
+        for agent in agents:
+            with agent._pending_lock:
+                pending.extend(request for request in agent._pending if request["batch_key"] == batch_key)
+                agent._pending = [request for request in agent._pending if request["batch_key"] != batch_key]
+        
+        if not pending:
+            return {}
+        
+        fallback = "Analysis completed. Unable to generate AI insights at this time."
+        responses = {request["prompt_id"]: fallback for request in pending}
+        
+        try:
+            job = self.client.batches.create(
+                model=self.model_name,
+                src=[{"contents": request["contents"], "config": request["config"]} for request in pending]
+            )
+            self.observability.emit("info", "batch_submitted", job=job.name, requests=len(pending))
+            
+            finished_states = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED",
+                               "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+            while job.state.name not in finished_states:
+                time.sleep(Config.BATCH_POLL_INTERVAL)
+                job = self.client.batches.get(name=job.name)
+            
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                self.observability.log_error("batch_failed", f"Batch job ended in {job.state.name}", job=job.name)
+                return responses
+            
+            # Inline responses come back in request order
+            for request, inlined in zip(pending, job.dest.inlined_responses):
+                if inlined.response is not None:
+                    responses[request["prompt_id"]] = inlined.response.text
+                else:
+                    self.observability.log_error("batch_request_failed", str(inlined.error),
+                                                 prompt_id=request["prompt_id"])
+        
+        except Exception as e:
+            self.observability.log_error("batch_failed", str(e))
+        
+        return responses
+    
+    def analyze_file(self, file_path: str, analysis_type: str = "comprehensive",
+                     progress_cb: Optional[Callable[[int, str], None]] = None,
+                     event_cb: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Coordinate a comprehensive analysis of a data file.
+        
+        Synchronous entry point that drives aanalyze_file on a fresh event loop.
+        When called from a running loop (a notebook cell or an async caller), the
+        analysis runs on a worker thread with its own loop instead.
+        
+        Args:
+            file_path: Path to the data file
+            analysis_type: Type of analysis to perform
+            progress_cb: Optional callback called as progress_cb(percent, message) at each milestone
+            event_cb: Optional callback receiving each partial result as it is produced
+            
+        Returns:
+            Dictionary with analysis results and report path
+        """
+        def run() -> Dict[str, Any]:
+            return asyncio.run(self.aanalyze_file(file_path, analysis_type, progress_cb, event_cb))
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
+        
+        # asyncio.run() cannot nest inside a running loop
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="analyze-file") as executor:
+            return executor.submit(run).result()
+    
+    def analyze_file_stream(self, file_path: str,
+                            analysis_type: str = "comprehensive") -> Iterator[Dict[str, Any]]:
+        """
+        Run analyze_file in a background thread and yield its events as they happen.
+        
+        Events are dictionaries with a "kind" key:
+        - progress: {"percent", "message"}
+        - viz: {"path"} for each visualization
+        - insight: {"data"} for each insight, as soon as it is generated
+        - report: {"path"} of the HTML report
+        - result: {"data"} with the same dictionary analyze_file returns (always last)
+        
+        Args:
+            file_path: Path to the data file
+            analysis_type: Type of analysis to perform
+            
+        Yields:
+            Event dictionaries
+        """
+        events: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        
+        def run() -> None:
+            try:
+                results = self.analyze_file(file_path, analysis_type, event_cb=events.put)
+            except Exception as e:
+                results = {"success": False, "error": str(e)}
+            events.put({"kind": "result", "data": results})
+            events.put(None)
+        
+        threading.Thread(target=run, name="analysis-stream", daemon=True).start()
+        
+        while True:
+            event = events.get()
+            if event is None:
+                return
+            yield event
+    
+    async def aanalyze_file(self, file_path: str, analysis_type: str = "comprehensive",
+                            progress_cb: Optional[Callable[[int, str], None]] = None,
+                            event_cb: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Coordinate a comprehensive analysis of a data file.
         
         Args:
             file_path: Path to the data file
             analysis_type: Type of analysis to perform
+            progress_cb: Optional callback called as progress_cb(percent, message) at each milestone
+                (always from the event loop's thread)
+            event_cb: Optional callback receiving each partial result as it is produced
+                (see analyze_file_stream for the event shapes)
             
         Returns:
             Dictionary with analysis results and report path
         """
+        def emit_event(kind: str, **data) -> None:
+            if event_cb is not None:
+                event_cb({"kind": kind, **data})
+        
+        def report_progress(percent: int, message: str) -> None:
+            if progress_cb is not None:
+                progress_cb(percent, message)
+            emit_event("progress", percent=percent, message=message)
+        
         # Start new session
         session = self.session_service.start_session()
+        batch_token = _BATCH_KEY.set(session.session_id)
         
         try:
             # Step 1: Data Ingestion
-            self.observability.logger.info("analysis_started", file=file_path, session=session.session_id)
+            report_progress(5, "📥 Ingesting data...")
+            self.observability.emit("info", "analysis_started", file=file_path, session=session.session_id)
             df = self.ingestion_tool.load_data(file_path)
             data_summary = self.ingestion_tool.get_data_summary(df)
             
+            # Shared by the analyst and the visualizer so the dtype scan happens once
+            numeric_cols = df.select_dtypes(include='number').columns
+            
             # Update session with dataset info
             session.dataset_info = {
                 "file_path": file_path,
@@ -467,50 +1222,66 @@ class CoordinatorAgent(BIAgent):
             context = self.memory_bank.get_relevant_context(data_summary["columns"])
             
             # Step 2: Parallel execution of analysis and visualization
-            # (Simulated parallel execution - in production, use asyncio or threading)
-            self.observability.logger.info("parallel_analysis_started", agents=["DataAnalyst", "Visualizer"])
+            self.observability.emit("info", "parallel_analysis_started", agents=["DataAnalyst", "Visualizer"])
+            report_progress(20, "🤖 Running parallel analysis (Analyst + Visualizer)...")
             
-            # Data analysis
-            analysis_results = self.data_analyst.analyze_dataset(df, data_summary)
+            # Visualizations only need the raw data, so they overlap with the analyst's Gemini call
+            if Config.BATCH_MODE:
+                analysis_results, visualizations = await asyncio.gather(
+                    asyncio.to_thread(self.data_analyst.queue_dataset_analysis, df, data_summary, numeric_cols),
+                    self.visualizer.acreate_visualizations(df, {}, numeric_cols)
+                )
+                batch_responses = await asyncio.to_thread(self._flush_batch)
+                analysis_results.ai_insights = batch_responses.get("dataset_analysis", "")
+            else:
+                analysis_results, visualizations = await asyncio.gather(
+                    self.data_analyst.aanalyze_dataset(df, data_summary, numeric_cols),
+                    self.visualizer.acreate_visualizations(df, {}, numeric_cols)
+                )
             self.memory_bank.add_analysis_result(session, "statistical_analysis", analysis_results)
-            
-            # Visualization (can run in parallel with analysis)
-            visualizations = self.visualizer.create_visualizations(df, analysis_results)
             for viz in visualizations:
                 self.memory_bank.add_visualization(session, viz)
+                emit_event("viz", path=viz)
             
             # Step 3: Sequential execution - generate insights and report
             # (Must wait for analysis and visualization to complete)
-            self.observability.logger.info("sequential_report_generation_started")
-            
-            insights = self.report_generator.generate_insights(
-                data_summary, 
-                analysis_results,
-                context
-            )
-            
-            # Ensure insights is a list
-            if not isinstance(insights, list):
-                insights = [str(insights)] if insights else []
+            self.observability.emit("info", "sequential_report_generation_started")
+            report_progress(60, "💡 Generating insights...")
             
-            # Store insights in memory
-            for insight in insights:
-                if insight and isinstance(insight, str):
+            if Config.BATCH_MODE:
+                self.report_generator.queue_insights(data_summary, analysis_results, context)
+                batch_responses = await asyncio.to_thread(self._flush_batch)
+                insights = self.report_generator._parse_insights(batch_responses.get("insights", ""))
+                
+                # Store insights in memory
+                for insight in insights:
+                    if insight and isinstance(insight, str):
+                        self.memory_bank.add_insight(session, insight, is_global=True)
+                        emit_event("insight", data=insight)
+            else:
+                # Store each insight in memory as soon as it streams in
+                insights = []
+                async for insight in self.report_generator.aiter_insights(data_summary, analysis_results, context):
+                    insights.append(insight)
                     self.memory_bank.add_insight(session, insight, is_global=True)
+                    emit_event("insight", data=insight)
+            
+            # Plain dict from here on: the report and callers serialize it to JSON
+            analysis_payload = analysis_results.to_dict()
             
             # Generate final report
+            report_progress(85, "📝 Generating report...")
             report_path = self.report_generator.generate_report(
                 data_summary=data_summary,
-                analysis_results=analysis_results,
+                analysis_results=analysis_payload,
                 visualizations=visualizations,
                 insights=insights
             )
-            
-            # Persist session
-            self.session_service.persist_session(session.session_id)
+            emit_event("report", path=report_path)
             
             # Log metrics
             self.observability.log_metrics_summary()
+            report_progress(100, "✅ Analysis complete!")
             
             return {
                 "success": True,
@@ -519,7 +1290,7 @@ class CoordinatorAgent(BIAgent):
                 "visualizations": visualizations,
                 "insights": insights,
                 "data_summary": data_summary,
-                "analysis_results": analysis_results
+                "analysis_results": analysis_payload
             }
         
         except Exception as e:
@@ -529,6 +1300,12 @@ class CoordinatorAgent(BIAgent):
                 "error": str(e),
                 "session_id": session.session_id
             }
+        
+        finally:
+            _BATCH_KEY.reset(batch_token)
+            # Persist the session (including changes the background flusher has not picked up yet)
+            # and drop it, so long-lived processes do not accumulate finished sessions
+            await asyncio.to_thread(self.session_service.end_session, session.session_id)
     
     def analyze_time_series(self, file_path: str, date_column: str, 
                            value_column: str) -> Dict[str, Any]:
@@ -544,6 +1321,7 @@ class CoordinatorAgent(BIAgent):
             Analysis results
         """
         session = self.session_service.start_session()
+        batch_token = _BATCH_KEY.set(session.session_id)
         
         try:
             # Load data
@@ -551,7 +1329,11 @@ class CoordinatorAgent(BIAgent):
             data_summary = self.ingestion_tool.get_data_summary(df)
             
             # Time series analysis
-            trend_results = self.data_analyst.analyze_time_series(df, date_column, value_column)
+            if Config.BATCH_MODE:
+                trend_results = self.data_analyst.queue_time_series_analysis(df, date_column, value_column)
+                trend_results["ai_insights"] = self._flush_batch().get("time_series_analysis", "")
+            else:
+                trend_results = self.data_analyst.analyze_time_series(df, date_column, value_column)
             self.memory_bank.add_analysis_result(session, "time_series", trend_results)
             
             # Create visualization
@@ -560,7 +1342,11 @@ class CoordinatorAgent(BIAgent):
                 self.memory_bank.add_visualization(session, viz_path)
             
             # Generate insights
-            insights = self.report_generator.generate_insights(data_summary, trend_results)
+            if Config.BATCH_MODE:
+                self.report_generator.queue_insights(data_summary, trend_results)
+                insights = self.report_generator._parse_insights(self._flush_batch().get("insights", ""))
+            else:
+                insights = self.report_generator.generate_insights(data_summary, trend_results)
             for insight in insights:
                 self.memory_bank.add_insight(session, insight)
             
@@ -572,8 +1358,6 @@ class CoordinatorAgent(BIAgent):
                 insights=insights
             )
             
-            self.session_service.persist_session(session.session_id)
-            
             return {
                 "success": True,
                 "session_id": session.session_id,
@@ -588,4 +1372,8 @@ class CoordinatorAgent(BIAgent):
                 "success": False,
                 "error": str(e)
             }
+        
+        finally:
+            _BATCH_KEY.reset(batch_token)
+            self.session_service.end_session(session.session_id)
 
@@ -3,59 +3,125 @@ Configuration management for the BI Intelligence Agent System.
 Handles API keys, model settings, and application configuration.
 """
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+_BASE_DIR = Path(__file__).parent
 
+# Load environment variables from the project's .env file, if there is one
+# (an explicit path skips python-dotenv's search through parent directories)
+_DOTENV_PATH = _BASE_DIR / ".env"
+if _DOTENV_PATH.exists():
+    load_dotenv(dotenv_path=_DOTENV_PATH, override=False)
 
-class Config:
-    """Central configuration for the BI Intelligence Agent System."""
+
+def _flag(value: str) -> bool:
+    """Parse a "true"/"false" environment value."""
+    return value.lower() == "true"
+
+
+def _env(name: str, default: str, cast: Callable[[str], Any] = str) -> Any:
+    """Dataclass field read from an environment variable when the config is created."""
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
+
+
+@dataclass(frozen=True)
+class _Config:
+    """
+    Central configuration for the BI Intelligence Agent System.
+    
+    Environment variables are read and coerced once, when the Config
+    singleton below is created; the instance is immutable afterwards.
+    """
     
     # API Configuration
-    GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
+    GOOGLE_API_KEY: str = _env("GOOGLE_API_KEY", "")
     
     # Model Configuration
     # Note: Using experimental model - has rate limits but better features
-    DEFAULT_MODEL: str = os.getenv("DEFAULT_MODEL", "gemini-2.0-flash-exp")
-    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
+    DEFAULT_MODEL: str = _env("DEFAULT_MODEL", "gemini-2.0-flash-exp")
+    TEMPERATURE: float = _env("TEMPERATURE", "0.7", float)
+    
+    # LLM Cache Configuration
+    LLM_CACHE_ENABLED: bool = _env("LLM_CACHE_ENABLED", "true", _flag)
+    # Off by default: templated prompts for same-schema datasets embed as near-duplicates,
+    # and every miss costs an extra embedding call
+    LLM_CACHE_SEMANTIC: bool = _env("LLM_CACHE_SEMANTIC", "false", _flag)
+    LLM_CACHE_SIMILARITY_THRESHOLD: float = _env("LLM_CACHE_SIMILARITY_THRESHOLD", "0.92", float)
+    EMBEDDING_MODEL: str = _env("EMBEDDING_MODEL", "text-embedding-004")
+    
+    # Gemini Context Cache Configuration
+    # Off by default: the built-in system instructions are far below Gemini's minimum
+    # cacheable size, so caches.create would only add a failing call per agent
+    CONTEXT_CACHE_ENABLED: bool = _env("CONTEXT_CACHE_ENABLED", "false", _flag)
+    CONTEXT_CACHE_MIN_TOKENS: int = _env("CONTEXT_CACHE_MIN_TOKENS", "1024", int)
+    CONTEXT_CACHE_TTL: str = _env("CONTEXT_CACHE_TTL", "3600s")
+    
+    # Batch Mode Configuration (non-interactive runs; ~50% cheaper, higher latency)
+    BATCH_MODE: bool = _env("BATCH_MODE", "false", _flag)
+    BATCH_POLL_INTERVAL: float = _env("BATCH_POLL_INTERVAL", "10", float)
+    
+    # Visualization Rendering
+    PARALLEL_RENDERING: bool = _env("PARALLEL_RENDERING", "true", _flag)
+    RENDER_WORKERS: int = _env("RENDER_WORKERS", "4", int)
+    PARALLEL_RENDER_MIN_ROWS: int = _env("PARALLEL_RENDER_MIN_ROWS", "10000", int)
+    REPORT_DPI: int = _env("REPORT_DPI", "120", int)
+    HEATMAP_DPI: int = _env("HEATMAP_DPI", "150", int)  # annotated cells need more pixels
+    # Heatmap cells with |r| below this are left unlabelled (0 labels every cell)
+    HEATMAP_ANNOTATION_MIN: float = _env("HEATMAP_ANNOTATION_MIN", "0", float)
+    
+    # Session Persistence (dirty sessions are written behind, at most this many seconds late)
+    SESSION_FLUSH_INTERVAL: float = _env("SESSION_FLUSH_INTERVAL", "0.5", float)
+    
+    # Evaluation history kept in memory (the JSONL file on disk keeps every record)
+    EVAL_HISTORY_MAX: int = _env("EVAL_HISTORY_MAX", "10000", int)
     
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    ENABLE_TRACING: bool = os.getenv("ENABLE_TRACING", "true").lower() == "true"
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO")
+    ENABLE_TRACING: bool = _env("ENABLE_TRACING", "true", _flag)
     
     # Paths
-    BASE_DIR: Path = Path(__file__).parent
-    DATA_DIR: Path = BASE_DIR / "data"
-    OUTPUT_DIR: Path = BASE_DIR / "outputs"
-    REPORTS_DIR: Path = BASE_DIR / "reports"
+    BASE_DIR: Path = _BASE_DIR
+    DATA_DIR: Path = _BASE_DIR / "data"
+    OUTPUT_DIR: Path = _BASE_DIR / "outputs"
+    REPORTS_DIR: Path = _BASE_DIR / "reports"
     
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """Validate that required configuration is present."""
-        if not cls.GOOGLE_API_KEY:
+        if not self.GOOGLE_API_KEY:
             raise ValueError(
                 "GOOGLE_API_KEY not found. Please set it in .env file or environment."
             )
         return True
     
-    @classmethod
-    def setup_directories(cls) -> None:
+    def setup_directories(self) -> None:
         """Create necessary directories if they don't exist."""
-        cls.DATA_DIR.mkdir(exist_ok=True)
-        cls.OUTPUT_DIR.mkdir(exist_ok=True)
-        cls.REPORTS_DIR.mkdir(exist_ok=True)
-        (cls.DATA_DIR / "examples").mkdir(exist_ok=True)
+        self.DATA_DIR.mkdir(exist_ok=True)
+        self.OUTPUT_DIR.mkdir(exist_ok=True)
+        self.REPORTS_DIR.mkdir(exist_ok=True)
+        (self.DATA_DIR / "examples").mkdir(exist_ok=True)
 
 
-# Validate configuration on import
-try:
+# Global configuration instance
+Config = _Config()
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_ready() -> bool:
+    """
+    Validate the configuration and create the working directories, once per process.
+    
+    Entry points call this before starting work, instead of doing it at import time.
+    A ValueError for a missing API key propagates to the caller and is not cached.
+    
+    Returns:
+        True when the configuration is valid
+    """
     Config.validate()
     Config.setup_directories()
-except ValueError as e:
-    print(f"Configuration Error: {e}")
-    print("Please copy .env.example to .env and add your GOOGLE_API_KEY")
+    return True
 
@@ -3,19 +3,67 @@ Demo script showcasing the BI Intelligence Agent System capabilities.
 This script demonstrates all key features required for the capstone project.
 """
 
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from config import Config
-from agents import CoordinatorAgent
-from memory import MemoryBank
+from config import Config, ensure_ready
 from observability import observability
 
+# The agent stack (google-genai, pandas, matplotlib) is imported inside the
+# demos that use it, so startup does not pay for it up front
+if TYPE_CHECKING:
+    from agents import CoordinatorAgent
+    from memory import MemoryBank
 
-def demo_comprehensive_analysis():
+
+class _DemoOutput:
+    """
+    sys.stdout stand-in that buffers each worker thread's prints separately.
+    
+    Lets demos run concurrently while each one's output is still printed as a
+    single uninterrupted block.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+    
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._stream).write(text)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+    
+    def run(self, demo: Callable, *args) -> None:
+        """Run a demo with its output buffered, then print it in one piece."""
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            demo(*args)
+        finally:
+            del self._local.buffer
+            with self._lock:
+                self._stream.write(buffer.getvalue())
+                self._stream.flush()
+
+
+def _create_coordinator() -> "CoordinatorAgent":
+    """Create a coordinator with its own memory bank, for demos run on their own."""
+    from agents import CoordinatorAgent
+    from memory import MemoryBank
+    
+    return CoordinatorAgent(MemoryBank())
+
+
+def demo_comprehensive_analysis(coordinator: Optional["CoordinatorAgent"] = None):
     """
     Demonstrate comprehensive data analysis with the multi-agent system.
     
@@ -31,8 +79,7 @@ def demo_comprehensive_analysis():
     
     # Initialize system
     print("🔧 Initializing multi-agent system...")
-    memory_bank = MemoryBank()
-    coordinator = CoordinatorAgent(memory_bank)
+    coordinator = coordinator or _create_coordinator()
     
     # Sample data file
     data_file = Config.DATA_DIR / "examples" / "sales_data.csv"
@@ -62,12 +109,15 @@ def demo_comprehensive_analysis():
         print(f"   • Memory: {summary['memory_usage']}")
         
         print(f"\n💡 Key Insights ({len(results['insights'])}):")
-        for i, insight in enumerate(results['insights'][:5], 1):
-            print(f"   {i}. {insight[:100]}...")
+        sys.stdout.write("".join(
+            f"   {i}. {insight[:100]}...\n"
+            for i, insight in enumerate(results['insights'][:5], 1)
+        ))
         
         print(f"\n📈 Visualizations: {len(results['visualizations'])} created")
-        for viz in results['visualizations']:
-            print(f"   • {Path(viz).name}")
+        sys.stdout.write("".join(
+            f"   • {Path(viz).name}\n" for viz in results['visualizations']
+        ))
         
         print(f"\n📄 Report: {results['report_path']}")
         
@@ -82,7 +132,7 @@ def demo_comprehensive_analysis():
         print(f"❌ Analysis failed: {results['error']}")
 
 
-def demo_time_series_analysis():
+def demo_time_series_analysis(coordinator: Optional["CoordinatorAgent"] = None):
     """
     Demonstrate time series analysis capabilities.
     
@@ -96,8 +146,7 @@ def demo_time_series_analysis():
     print("="*80 + "\n")
     
     # Initialize system
-    memory_bank = MemoryBank()
-    coordinator = CoordinatorAgent(memory_bank)
+    coordinator = coordinator or _create_coordinator()
     
     # Sample data file
     data_file = Config.DATA_DIR / "examples" / "sales_data.csv"
@@ -134,7 +183,7 @@ def demo_time_series_analysis():
         print(f"❌ Analysis failed: {results['error']}")
 
 
-def demo_memory_and_sessions():
+def demo_memory_and_sessions(memory_bank: Optional["MemoryBank"] = None):
     """
     Demonstrate memory bank and session management.
     
@@ -147,7 +196,9 @@ def demo_memory_and_sessions():
     print("DEMO 3: Memory Bank & Session Management")
     print("="*80 + "\n")
     
-    memory_bank = MemoryBank()
+    if memory_bank is None:
+        from memory import MemoryBank
+        memory_bank = MemoryBank()
     
     print("📚 Memory Bank Features:")
     print("   • Persistent session storage")
@@ -159,16 +210,21 @@ def demo_memory_and_sessions():
     sessions = memory_bank.list_sessions()
     print(f"📋 Found {len(sessions)} session(s) in memory:\n")
     
-    for session in sessions[:5]:  # Show last 5
-        print(f"   Session: {session['session_id']}")
-        print(f"   Created: {session['created_at']}")
-        print(f"   Dataset: {session['dataset']}")
-        print("   " + "-"*60)
+    separator = "   " + "-"*60
+    sys.stdout.write("".join(  # Show last 5
+        f"   Session: {session['session_id']}\n"
+        f"   Created: {session['created_at']}\n"
+        f"   Dataset: {session['dataset']}\n"
+        f"{separator}\n"
+        for session in sessions[:5]
+    ))
     
     # Show global insights
     print(f"\n💡 Global Insights Learned: {len(memory_bank.global_insights)}")
-    for i, insight in enumerate(memory_bank.global_insights[-3:], 1):
-        print(f"   {i}. {insight[:80]}...")
+    sys.stdout.write("".join(
+        f"   {i}. {insight[:80]}...\n"
+        for i, insight in enumerate(memory_bank.global_insights[-3:], 1)
+    ))
 
 
 def demo_observability():
@@ -219,12 +275,28 @@ def main():
     
     try:
         # Check configuration
-        Config.validate()
+        ensure_ready()
+        
+        # One coordinator and memory bank serve every demo
+        coordinator = _create_coordinator()
+        
+        # The two analysis demos are independent, so run them concurrently.
+        # Each demo's output is buffered and printed whole when it finishes.
+        output = _DemoOutput(sys.stdout)
+        sys.stdout = output
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(output.run, demo_comprehensive_analysis, coordinator),
+                    executor.submit(output.run, demo_time_series_analysis, coordinator)
+                ]
+                for future in as_completed(futures):
+                    future.result()
+        finally:
+            sys.stdout = output._stream
         
-        # Run demos
-        demo_comprehensive_analysis()
-        demo_time_series_analysis()
-        demo_memory_and_sessions()
+        # These report on the state the analyses produced
+        demo_memory_and_sessions(coordinator.memory_bank)
         demo_observability()
         
         print("\n" + "="*80)
@@ -3,40 +3,254 @@ Evaluation module for assessing agent performance and system quality.
 Provides metrics and scoring for continuous improvement.
 """
 
+import atexit
 import time
 import json
-from typing import Dict, List, Any
-from datetime import datetime
+import operator
+import os
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, NamedTuple, Optional
+from datetime import datetime, timezone
 from pathlib import Path
 
 from config import Config
 from observability import observability
 
 
+# Text report for a single evaluation, as a %-format over the flattened evaluation.
+# Fields listed in _REPORT_PERCENT_FIELDS are scaled to percentages first.
+EVALUATION_REPORT_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                    AGENT EVALUATION REPORT                           ║
+╚══════════════════════════════════════════════════════════════════════╝
+
+Session: %(session_id)s
+Timestamp: %(timestamp)s
+
+OVERALL SCORE: %(overall_score).1f/100
+GRADE: %(grade)s
+
+───────────────────────────────────────────────────────────────────────
+QUALITY METRICS
+───────────────────────────────────────────────────────────────────────
+Completeness:              %(completeness).2f%%
+Insight Quality:           %(insight_quality).2f%%
+Visualization Coverage:    %(visualization_coverage).2f%%
+Data Coverage:             %(data_coverage).2f%%
+Overall Quality:           %(overall_quality).2f%%
+
+───────────────────────────────────────────────────────────────────────
+PERFORMANCE METRICS
+───────────────────────────────────────────────────────────────────────
+Execution Time:            %(execution_time_seconds).2fs
+Agent Calls:               %(agent_calls)s
+Tool Executions:           %(tool_executions)s
+Average Tool Time:         %(avg_tool_time).3fs
+Error Rate:                %(error_rate).2f%%
+Overall Performance:       %(overall_performance).2f%%
+
+───────────────────────────────────────────────────────────────────────
+MEMORY METRICS
+───────────────────────────────────────────────────────────────────────
+Insights Stored:           %(insights_stored)s
+Visualizations:            %(visualizations_stored)s
+Analysis History:          %(analysis_history_length)s
+Global Insights:           %(global_insights_total)s
+Memory Effectiveness:      %(memory_effectiveness).2f%%
+
+───────────────────────────────────────────────────────────────────────
+RECOMMENDATIONS
+───────────────────────────────────────────────────────────────────────
+"""
+
+_REPORT_PERCENT_FIELDS = (
+    'completeness', 'insight_quality', 'visualization_coverage', 'data_coverage',
+    'overall_quality', 'error_rate', 'overall_performance', 'memory_effectiveness'
+)
+
+# History appends run here, off the evaluation path. A single worker keeps
+# them in submission order across every AgentEvaluator.
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evaluator-io")
+atexit.register(_io_pool.shutdown, wait=True)
+
+
+class QualityScores(NamedTuple):
+    """Quality scores for an analysis run (0-1 scale)."""
+    completeness: float
+    insight_quality: float
+    visualization_coverage: float
+    data_coverage: float
+    overall_quality: float
+
+
+_ZERO_QUALITY_SCORES = QualityScores(0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+class PerformanceMetrics(NamedTuple):
+    """Performance metrics and scores for an analysis run."""
+    execution_time_seconds: float
+    agent_calls: int
+    tool_executions: int
+    avg_tool_time: float
+    error_rate: float
+    errors: int
+    speed_score: float
+    efficiency_score: float
+    reliability_score: float
+    overall_performance: float
+
+
+class MemoryMetrics(NamedTuple):
+    """Memory system metrics; all zero with an error when the session is missing."""
+    insights_stored: int = 0
+    visualizations_stored: int = 0
+    analysis_history_length: int = 0
+    global_insights_total: int = 0
+    learned_patterns_count: int = 0
+    memory_effectiveness: float = 0.0
+    error: Optional[str] = None
+
+
+# Evaluation sections and the payload type each one holds
+_SECTION_TYPES = (
+    ('quality_scores', QualityScores),
+    ('performance_metrics', PerformanceMetrics),
+    ('memory_metrics', MemoryMetrics),
+)
+
+
+def _to_record(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an evaluation to plain JSON-serializable dicts."""
+    record = dict(evaluation)
+    for section, _ in _SECTION_TYPES:
+        record[section] = record[section]._asdict()
+    return record
+
+
+def _from_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild an evaluation's section payloads from a stored record."""
+    evaluation = dict(record)
+    for section, payload_type in _SECTION_TYPES:
+        values = record.get(section) or {}
+        evaluation[section] = payload_type(**{
+            key: value for key, value in values.items() if key in payload_type._fields
+        })
+    return evaluation
+
+
 class AgentEvaluator:
     """
     Evaluates agent performance across multiple dimensions.
     Provides quantitative metrics for system quality assessment.
     """
     
+    # Lower bound of each grade above F; bisect_right maps a score onto _GRADE_LABELS
+    _GRADE_THRESHOLDS = (60, 70, 80, 90)
+    _GRADE_LABELS = ('F - Poor', 'D - Needs Improvement', 'C - Satisfactory', 'B - Good', 'A - Excellent')
+    
+    # Improvement rules: (section, metric, comparison, limit, message or message(value))
+    _RECOMMENDATION_RULES = (
+        # Quality recommendations
+        ('quality_scores', 'completeness', operator.lt, 0.8,
+         "Improve completeness: Ensure all analysis components are generated"),
+        ('quality_scores', 'insight_quality', operator.lt, 0.7,
+         "Enhance insight quality: Generate more detailed and actionable insights"),
+        ('quality_scores', 'visualization_coverage', operator.lt, 0.7,
+         "Increase visualization coverage: Create more diverse visualizations"),
+        # Performance recommendations
+        ('performance_metrics', 'execution_time_seconds', operator.gt, 60,
+         lambda value: f"Optimize execution time: Currently {value:.1f}s, target < 60s"),
+        ('performance_metrics', 'error_rate', operator.gt, 0.1,
+         lambda value: f"Reduce error rate: Currently {value:.1%}, target < 10%"),
+        # Memory recommendations
+        ('memory_metrics', 'memory_effectiveness', operator.lt, 0.5,
+         "Improve memory utilization: Store more insights and patterns for context"),
+    )
+    
     def __init__(self):
         """Initialize the evaluator."""
-        self.evaluation_history = []
-        self.metrics_path = Config.BASE_DIR / "evaluation_metrics.json"
+        # Rolling window of recent evaluations; the full history lives in the JSONL file
+        self.evaluation_history = deque(maxlen=Config.EVAL_HISTORY_MAX or None)
+        
+        # Running aggregates over the history, so trends never rescan it
+        self._count = 0
+        self._sum_quality = 0.0
+        self._sum_performance = 0.0
+        self._sum_score = 0.0
+        self._best_score = float('-inf')
+        self._worst_score = float('inf')
+        self._last_scores = deque(maxlen=2)  # The two most recent overall scores
+        
+        # One evaluation per line, so saving a new evaluation is a single append
+        self.metrics_path = Config.BASE_DIR / "evaluation_metrics.jsonl"
+        self.legacy_metrics_path = Config.BASE_DIR / "evaluation_metrics.json"
         self.load_history()
     
     def load_history(self) -> None:
-        """Load evaluation history from disk."""
+        """Load evaluation history from disk, migrating the legacy JSON array file if present."""
+        # Let appends queued by earlier evaluators land before reading
+        _io_pool.submit(lambda: None).result()
+        
+        if self.legacy_metrics_path.exists() and not self.metrics_path.exists():
+            self._migrate_legacy_history()
+        
         if self.metrics_path.exists():
             with open(self.metrics_path, 'r') as f:
-                self.evaluation_history = json.load(f)
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        evaluation = _from_record(json.loads(line))
+                        self._update_aggregates(evaluation)
+                    except (ValueError, TypeError, KeyError, AttributeError):
+                        # A partially written last line from an interrupted append,
+                        # or a malformed record missing required fields
+                        continue
+                    self.evaluation_history.append(evaluation)
     
-    def save_history(self) -> None:
-        """Save evaluation history to disk."""
-        with open(self.metrics_path, 'w') as f:
-            json.dump(self.evaluation_history, f, indent=2)
+    def _update_aggregates(self, evaluation: Dict[str, Any]) -> None:
+        """Fold one evaluation into the running trend aggregates."""
+        # Read every field before touching the aggregates, so a malformed record leaves them unchanged
+        score = float(evaluation['overall_score'])
+        quality = float(evaluation['quality_scores'].overall_quality)
+        performance = float(evaluation['performance_metrics'].overall_performance)
+        self._count += 1
+        self._sum_quality += quality
+        self._sum_performance += performance
+        self._sum_score += score
+        if score > self._best_score:
+            self._best_score = score
+        if score < self._worst_score:
+            self._worst_score = score
+        self._last_scores.append(score)
     
-    def evaluate_analysis_quality(self, results: Dict[str, Any]) -> Dict[str, float]:
+    def _migrate_legacy_history(self) -> None:
+        """Rewrite the legacy evaluation_metrics.json array as JSONL."""
+        with open(self.legacy_metrics_path, 'r') as f:
+            history = json.load(f)
+        
+        # Write a sibling file and rename it into place, so an interrupted
+        # migration never leaves a truncated history behind
+        tmp_path = self.metrics_path.with_suffix('.jsonl.tmp')
+        with open(tmp_path, 'w') as f:
+            for evaluation in history:
+                f.write(json.dumps(evaluation, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, self.metrics_path)
+        
+        self.legacy_metrics_path.unlink()
+    
+    def _append_evaluation(self, evaluation: Dict[str, Any]) -> None:
+        """Append one evaluation to the history file (runs on the I/O thread)."""
+        try:
+            with open(self.metrics_path, 'a') as f:
+                f.write(json.dumps(_to_record(evaluation), separators=(',', ':')) + '\n')
+        except Exception as e:
+            observability.emit("error", "evaluation_save_failed", error=str(e))
+    
+    def evaluate_analysis_quality(self, results: Dict[str, Any]) -> QualityScores:
         """
         Evaluate the quality of an analysis run.
         
@@ -44,81 +258,92 @@ class AgentEvaluator:
             results: Analysis results dictionary
             
         Returns:
-            Dictionary of quality scores (0-1 scale)
+            Quality scores (0-1 scale)
         """
-        scores = {}
+        results_get = results.get
         
         # 1. Completeness Score
         # Check if all expected outputs are present
         expected_keys = ['insights', 'visualizations', 'report_path', 'data_summary']
-        completeness = sum(1 for key in expected_keys if key in results and results[key]) / len(expected_keys)
-        scores['completeness'] = completeness
+        completeness = sum(1 for key in expected_keys if results_get(key)) / len(expected_keys)
+        if completeness == 0:
+            # Nothing was produced (a failed run), so every other score is 0 too
+            return _ZERO_QUALITY_SCORES
         
         # 2. Insight Quality Score
-        # Based on number and depth of insights
-        insights = results.get('insights', [])
-        insight_score = min(len(insights) / 5.0, 1.0)  # Target: 5+ insights
-        avg_insight_length = sum(len(i) for i in insights) / len(insights) if insights else 0
-        depth_score = min(avg_insight_length / 100.0, 1.0)  # Target: 100+ chars per insight
-        scores['insight_quality'] = (insight_score + depth_score) / 2
+        # Based on number and depth of insights (count and total length in one pass)
+        n_insights = 0
+        total_length = 0
+        for insight in results_get('insights') or ():
+            n_insights += 1
+            total_length += len(insight)
+        insight_score = 1.0 if n_insights >= 5 else n_insights / 5.0  # Target: 5+ insights
+        avg_insight_length = total_length / n_insights if n_insights else 0
+        depth_score = 1.0 if avg_insight_length >= 100 else avg_insight_length / 100.0  # Target: 100+ chars per insight
+        insight_quality = (insight_score + depth_score) / 2
         
         # 3. Visualization Coverage Score
         # Based on number of visualizations created
-        viz_count = len(results.get('visualizations', []))
-        scores['visualization_coverage'] = min(viz_count / 3.0, 1.0)  # Target: 3+ visualizations
+        viz_count = len(results_get('visualizations') or ())
+        visualization_coverage = 1.0 if viz_count >= 3 else viz_count / 3.0  # Target: 3+ visualizations
         
         # 4. Data Coverage Score
         # Based on how much of the data was analyzed
-        data_summary = results.get('data_summary', {})
+        data_coverage = 0
+        data_summary = results_get('data_summary')
         if data_summary:
-            total_cols = data_summary.get('shape', {}).get('columns', 0)
-            analyzed_cols = len(results.get('analysis_results', {}).get('correlation_analysis', {}).get('correlation_matrix', {}))
-            scores['data_coverage'] = min(analyzed_cols / total_cols, 1.0) if total_cols > 0 else 0
-        else:
-            scores['data_coverage'] = 0
+            shape = data_summary.get('shape')
+            total_cols = shape.get('columns', 0) if shape else 0
+            analysis_results = results_get('analysis_results')
+            correlation_analysis = analysis_results.get('correlation_analysis') if analysis_results else None
+            correlation_matrix = correlation_analysis.get('correlation_matrix') if correlation_analysis else None
+            analyzed_cols = len(correlation_matrix) if correlation_matrix else 0
+            if total_cols > 0:
+                coverage = analyzed_cols / total_cols
+                data_coverage = coverage if coverage < 1.0 else 1.0
         
         # 5. Overall Quality Score
-        scores['overall_quality'] = sum(scores.values()) / len(scores)
+        overall_quality = (completeness + insight_quality + visualization_coverage + data_coverage) * 0.25
         
-        return scores
+        return QualityScores(completeness, insight_quality, visualization_coverage,
+                             data_coverage, overall_quality)
     
     def evaluate_performance(self, results: Dict[str, Any], 
-                           execution_time: float) -> Dict[str, Any]:
+                           execution_time: float,
+                           metrics: Optional[Dict[str, Any]] = None) -> PerformanceMetrics:
         """
         Evaluate system performance metrics.
         
         Args:
             results: Analysis results
             execution_time: Total execution time in seconds
+            metrics: Observability metrics snapshot (taken now if not given)
             
         Returns:
-            Performance metrics dictionary
+            Performance metrics
         """
-        metrics = observability.get_metrics()
-        
-        performance = {
-            'execution_time_seconds': execution_time,
-            'agent_calls': metrics['agent_calls'],
-            'tool_executions': metrics['tool_executions'],
-            'avg_tool_time': metrics['avg_processing_time'],
-            'error_rate': metrics['error_rate'],
-            'errors': metrics['errors']
-        }
+        if metrics is None:
+            metrics = observability.get_metrics()
         
         # Performance scores (0-1 scale, higher is better)
-        performance['speed_score'] = max(0, 1 - (execution_time / 60.0))  # Target: < 60 seconds
-        performance['efficiency_score'] = max(0, 1 - metrics['error_rate'])  # Target: 0% errors
-        performance['reliability_score'] = 1.0 if results.get('success', False) else 0.0
-        
-        performance['overall_performance'] = (
-            performance['speed_score'] +
-            performance['efficiency_score'] +
-            performance['reliability_score']
-        ) / 3
-        
-        return performance
+        speed_score = max(0, 1 - (execution_time / 60.0))  # Target: < 60 seconds
+        efficiency_score = max(0, 1 - metrics['error_rate'])  # Target: 0% errors
+        reliability_score = 1.0 if results.get('success', False) else 0.0
+        
+        return PerformanceMetrics(
+            execution_time_seconds=execution_time,
+            agent_calls=metrics['agent_calls'],
+            tool_executions=metrics['tool_executions'],
+            avg_tool_time=metrics['avg_processing_time'],
+            error_rate=metrics['error_rate'],
+            errors=metrics['errors'],
+            speed_score=speed_score,
+            efficiency_score=efficiency_score,
+            reliability_score=reliability_score,
+            overall_performance=(speed_score + efficiency_score + reliability_score) / 3
+        )
     
-    def evaluate_memory_usage(self, session_id: str, memory_bank) -> Dict[str, Any]:
+    def evaluate_memory_usage(self, session_id: str, memory_bank) -> MemoryMetrics:
         """
         Evaluate memory system effectiveness.
         
@@ -132,26 +357,25 @@ class AgentEvaluator:
         session = memory_bank.load_session(session_id)
         
         if not session:
-            return {'error': 'Session not found'}
-        
-        metrics = {
-            'insights_stored': len(session.insights),
-            'visualizations_stored': len(session.visualizations),
-            'analysis_history_length': len(session.analysis_history),
-            'global_insights_total': len(memory_bank.global_insights),
-            'learned_patterns_count': sum(len(v) if isinstance(v, list) else 1 
-                                         for v in memory_bank.learned_patterns.values())
-        }
-        
-        # Memory effectiveness score
-        metrics['memory_effectiveness'] = min(
-            (metrics['insights_stored'] + 
-             metrics['visualizations_stored'] + 
-             metrics['analysis_history_length']) / 10.0,
-            1.0
+            return MemoryMetrics(error='Session not found')
+        
+        insights_stored = len(session.insights)
+        visualizations_stored = len(session.visualizations)
+        analysis_history_length = len(session.analysis_history)
+        
+        return MemoryMetrics(
+            insights_stored=insights_stored,
+            visualizations_stored=visualizations_stored,
+            analysis_history_length=analysis_history_length,
+            global_insights_total=len(memory_bank.global_insights),
+            learned_patterns_count=sum(len(v) if isinstance(v, list) else 1 
+                                       for v in memory_bank.learned_patterns.values()),
+            # Memory effectiveness score
+            memory_effectiveness=min(
+                (insights_stored + visualizations_stored + analysis_history_length) / 10.0,
+                1.0
+            )
         )
-        
-        return metrics
     
     def comprehensive_evaluation(self, results: Dict[str, Any], 
                                 execution_time: float,
@@ -169,39 +393,33 @@ class AgentEvaluator:
         Returns:
             Complete evaluation report
         """
+        # One consistent metrics snapshot for the whole evaluation
+        metrics = observability.get_metrics()
+        
+        quality = self.evaluate_analysis_quality(results)
+        performance = self.evaluate_performance(results, execution_time, metrics)
+        memory = self.evaluate_memory_usage(session_id, memory_bank)
+        
+        # Calculate overall system score (0-100)
+        overall_score = (quality.overall_quality * 50 + 
+                         performance.overall_performance * 30 + 
+                         memory.memory_effectiveness * 20)
+        
         evaluation = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
             'session_id': session_id,
-            'quality_scores': self.evaluate_analysis_quality(results),
-            'performance_metrics': self.evaluate_performance(results, execution_time),
-            'memory_metrics': self.evaluate_memory_usage(session_id, memory_bank)
+            'quality_scores': quality,
+            'performance_metrics': performance,
+            'memory_metrics': memory,
+            'overall_score': overall_score,
+            # Grade the system
+            'grade': self._GRADE_LABELS[bisect_right(self._GRADE_THRESHOLDS, overall_score)]
         }
         
-        # Calculate overall system score (0-100)
-        quality_score = evaluation['quality_scores']['overall_quality']
-        performance_score = evaluation['performance_metrics']['overall_performance']
-        memory_score = evaluation['memory_metrics'].get('memory_effectiveness', 0)
-        
-        evaluation['overall_score'] = (quality_score * 0.5 + 
-                                      performance_score * 0.3 + 
-                                      memory_score * 0.2) * 100
-        
-        # Grade the system
-        score = evaluation['overall_score']
-        if score >= 90:
-            evaluation['grade'] = 'A - Excellent'
-        elif score >= 80:
-            evaluation['grade'] = 'B - Good'
-        elif score >= 70:
-            evaluation['grade'] = 'C - Satisfactory'
-        elif score >= 60:
-            evaluation['grade'] = 'D - Needs Improvement'
-        else:
-            evaluation['grade'] = 'F - Poor'
-        
         # Store evaluation
         self.evaluation_history.append(evaluation)
-        self.save_history()
+        self._update_aggregates(evaluation)
+        _io_pool.submit(self._append_evaluation, evaluation)
         
         return evaluation
     
@@ -217,42 +435,10 @@ class AgentEvaluator:
         """
         recommendations = []
         
-        quality = evaluation['quality_scores']
-        performance = evaluation['performance_metrics']
-        
-        # Quality recommendations
-        if quality['completeness'] < 0.8:
-            recommendations.append(
-                "Improve completeness: Ensure all analysis components are generated"
-            )
-        
-        if quality['insight_quality'] < 0.7:
-            recommendations.append(
-                "Enhance insight quality: Generate more detailed and actionable insights"
-            )
-        
-        if quality['visualization_coverage'] < 0.7:
-            recommendations.append(
-                "Increase visualization coverage: Create more diverse visualizations"
-            )
-        
-        # Performance recommendations
-        if performance['execution_time_seconds'] > 60:
-            recommendations.append(
-                f"Optimize execution time: Currently {performance['execution_time_seconds']:.1f}s, target < 60s"
-            )
-        
-        if performance['error_rate'] > 0.1:
-            recommendations.append(
-                f"Reduce error rate: Currently {performance['error_rate']:.1%}, target < 10%"
-            )
-        
-        # Memory recommendations
-        memory = evaluation['memory_metrics']
-        if memory.get('memory_effectiveness', 0) < 0.5:
-            recommendations.append(
-                "Improve memory utilization: Store more insights and patterns for context"
-            )
+        for section, key, compare, limit, message in self._RECOMMENDATION_RULES:
+            value = getattr(evaluation[section], key)
+            if compare(value, limit):
+                recommendations.append(message(value) if callable(message) else message)
         
         if not recommendations:
             recommendations.append("System is performing well! Continue monitoring.")
@@ -271,55 +457,25 @@ class AgentEvaluator:
         """
         recommendations = self.get_improvement_recommendations(evaluation)
         
-        report = f"""
-╔══════════════════════════════════════════════════════════════════════╗
-║                    AGENT EVALUATION REPORT                           ║
-╚══════════════════════════════════════════════════════════════════════╝
-
-Session: {evaluation['session_id']}
-Timestamp: {evaluation['timestamp']}
-
-OVERALL SCORE: {evaluation['overall_score']:.1f}/100
-GRADE: {evaluation['grade']}
-
-───────────────────────────────────────────────────────────────────────
-QUALITY METRICS
-───────────────────────────────────────────────────────────────────────
-Completeness:              {evaluation['quality_scores']['completeness']:.2%}
-Insight Quality:           {evaluation['quality_scores']['insight_quality']:.2%}
-Visualization Coverage:    {evaluation['quality_scores']['visualization_coverage']:.2%}
-Data Coverage:             {evaluation['quality_scores']['data_coverage']:.2%}
-Overall Quality:           {evaluation['quality_scores']['overall_quality']:.2%}
-
-───────────────────────────────────────────────────────────────────────
-PERFORMANCE METRICS
-───────────────────────────────────────────────────────────────────────
-Execution Time:            {evaluation['performance_metrics']['execution_time_seconds']:.2f}s
-Agent Calls:               {evaluation['performance_metrics']['agent_calls']}
-Tool Executions:           {evaluation['performance_metrics']['tool_executions']}
-Average Tool Time:         {evaluation['performance_metrics']['avg_tool_time']:.3f}s
-Error Rate:                {evaluation['performance_metrics']['error_rate']:.2%}
-Overall Performance:       {evaluation['performance_metrics']['overall_performance']:.2%}
-
-───────────────────────────────────────────────────────────────────────
-MEMORY METRICS
-───────────────────────────────────────────────────────────────────────
-Insights Stored:           {evaluation['memory_metrics'].get('insights_stored', 0)}
-Visualizations:            {evaluation['memory_metrics'].get('visualizations_stored', 0)}
-Analysis History:          {evaluation['memory_metrics'].get('analysis_history_length', 0)}
-Global Insights:           {evaluation['memory_metrics'].get('global_insights_total', 0)}
-Memory Effectiveness:      {evaluation['memory_metrics'].get('memory_effectiveness', 0):.2%}
-
-───────────────────────────────────────────────────────────────────────
-RECOMMENDATIONS
-───────────────────────────────────────────────────────────────────────
-"""
-        for i, rec in enumerate(recommendations, 1):
-            report += f"{i}. {rec}\n"
+        fields = {
+            **evaluation['quality_scores']._asdict(),
+            **evaluation['performance_metrics']._asdict(),
+            **evaluation['memory_metrics']._asdict(),
+            'session_id': evaluation['session_id'],
+            'timestamp': evaluation['timestamp'],
+            'overall_score': evaluation['overall_score'],
+            'grade': evaluation['grade']
+        }
+        for name in _REPORT_PERCENT_FIELDS:
+            fields[name] *= 100
         
-        report += "\n═══════════════════════════════════════════════════════════════════════\n"
+        recommendation_lines = ''.join(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
         
-        return report
+        return (
+            EVALUATION_REPORT_TEMPLATE % fields
+            + recommendation_lines
+            + "\n═══════════════════════════════════════════════════════════════════════\n"
+        )
     
     def get_historical_trends(self) -> Dict[str, Any]:
         """
@@ -328,35 +484,24 @@ RECOMMENDATIONS
         Returns:
             Dictionary of trend analysis
         """
-        if not self.evaluation_history:
+        if not self._count:
             return {"message": "No evaluation history available"}
         
-        # Calculate averages over time
-        avg_quality = sum(e['quality_scores']['overall_quality'] 
-                         for e in self.evaluation_history) / len(self.evaluation_history)
-        
-        avg_performance = sum(e['performance_metrics']['overall_performance'] 
-                             for e in self.evaluation_history) / len(self.evaluation_history)
-        
-        avg_score = sum(e['overall_score'] 
-                       for e in self.evaluation_history) / len(self.evaluation_history)
-        
         # Trend direction
-        if len(self.evaluation_history) >= 2:
-            recent_score = self.evaluation_history[-1]['overall_score']
-            older_score = self.evaluation_history[-2]['overall_score']
+        if len(self._last_scores) == 2:
+            older_score, recent_score = self._last_scores
             trend = "improving" if recent_score > older_score else "declining" if recent_score < older_score else "stable"
         else:
             trend = "insufficient data"
         
         return {
-            "total_evaluations": len(self.evaluation_history),
-            "average_quality_score": avg_quality,
-            "average_performance_score": avg_performance,
-            "average_overall_score": avg_score,
+            "total_evaluations": self._count,
+            "average_quality_score": self._sum_quality / self._count,
+            "average_performance_score": self._sum_performance / self._count,
+            "average_overall_score": self._sum_score / self._count,
             "trend": trend,
-            "best_score": max(e['overall_score'] for e in self.evaluation_history),
-            "worst_score": min(e['overall_score'] for e in self.evaluation_history)
+            "best_score": self._best_score,
+            "worst_score": self._worst_score
         }
 
 
@@ -0,0 +1,183 @@
+"""
+Numeric kernels for the BI Intelligence Agent System.
+Operate on a single contiguous float block instead of per-column pandas objects.
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def numeric_block(df: pd.DataFrame, dtype=np.float64,
+                  columns: Optional[Sequence[str]] = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Extract the numeric columns of a DataFrame as one 2-D array.
+    
+    Args:
+        df: DataFrame to extract from
+        dtype: Float dtype of the returned block
+        columns: Numeric columns already known to the caller (skips the dtype scan)
+    
+    Returns:
+        Tuple of (column names, array of shape (rows, numeric columns))
+    """
+    numeric_df = df.select_dtypes(include=[np.number]) if columns is None else df[list(columns)]
+    columns = list(numeric_df.columns)
+    block = numeric_df.to_numpy(dtype=dtype, copy=False, na_value=np.nan)
+    return columns, block
+
+
+# Largest magnitude-to-range ratio a column may have and still be reduced to float32.
+# float32 keeps about 7 significant digits, so this leaves ~4 digits of each column's spread.
+FLOAT32_MAX_RATIO = 1e3
+
+
+def float32_block(df: pd.DataFrame,
+                  columns: Optional[Sequence[str]] = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Extract the numeric columns as a float32 block, halving the bytes the kernels stream.
+    
+    Falls back to float64 when a value is outside the float32 range (it would
+    overflow to infinity) or when a column's values are large relative to
+    their range (e.g. epoch timestamps), where float32 rounding would swamp
+    the differences the statistics are computed from.
+    
+    Args:
+        df: DataFrame to extract from
+        columns: Numeric columns already known to the caller (skips the dtype scan)
+    
+    Returns:
+        Tuple of (column names, array of shape (rows, numeric columns))
+    """
+    names, block = numeric_block(df, np.float64, columns)
+    if block.size == 0:
+        return names, block.astype(np.float32)
+    
+    with warnings.catch_warnings():
+        # All-NaN columns reduce to NaN, which never triggers the fallback
+        warnings.simplefilter("ignore", RuntimeWarning)
+        magnitude = np.nanmax(np.abs(block), axis=0)
+        spread = np.nanmax(block, axis=0) - np.nanmin(block, axis=0)
+    
+    varying = spread > 0
+    if ((magnitude > np.finfo(np.float32).max).any()
+            or (magnitude[varying] > FLOAT32_MAX_RATIO * spread[varying]).any()):
+        return names, block
+    return names, block.astype(np.float32)
+
+
+def correlation_matrix(block: np.ndarray) -> np.ndarray:
+    """
+    Compute the Pearson correlation matrix of the columns of a float block.
+    
+    Columns are centred and scaled once, then the full matrix comes out of a
+    single matrix product. Blocks containing NaN fall back to pandas, which
+    uses pairwise-complete observations.
+    
+    Args:
+        block: Array of shape (rows, columns)
+    
+    Returns:
+        Correlation matrix of shape (columns, columns)
+    """
+    n_cols = block.shape[1]
+    if block.shape[0] < 2:
+        return np.full((n_cols, n_cols), np.nan)
+    
+    if np.isnan(block).any():
+        return pd.DataFrame(block).corr().to_numpy()
+    
+    # Detect constant columns from the raw values: after centring, rounding in the
+    # mean can leave a tiny nonzero residual that would otherwise correlate as +/-1
+    constant = np.ptp(block, axis=0) == 0
+    
+    centered = block - block.mean(axis=0)
+    centered[:, constant] = 0
+    std = np.sqrt((centered * centered).sum(axis=0))
+    std[constant] = 1
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = centered / std
+        corr = normalized.T @ normalized
+    
+    # Constant columns have no defined correlation, matching pandas
+    corr[:, constant] = np.nan
+    corr[constant, :] = np.nan
+    
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, np.where(constant, np.nan, 1.0))
+    return corr
+
+
+def iqr_outlier_stats(block: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute IQR outlier statistics for every column of a float block at once.
+    
+    Missing values are ignored when computing quartiles, like pandas' quantile.
+    
+    Args:
+        block: Array of shape (rows, columns)
+    
+    Returns:
+        Dictionary of per-column arrays: q1, median, q3, iqr, lower, upper, outlier_count
+    """
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q1, median, q3 = np.nanquantile(block, [0.25, 0.5, 0.75], axis=0)
+        iqr = q3 - q1
+        lower = q1 - 1.5 * iqr
+        upper = q3 + 1.5 * iqr
+        outlier_count = ((block < lower) | (block > upper)).sum(axis=0)
+    
+    return {
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "iqr": iqr,
+        "lower": lower,
+        "upper": upper,
+        "outlier_count": outlier_count
+    }
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick the points that keep a line chart's shape, using Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept. The points between them are split
+    into n_out - 2 buckets, and each bucket keeps the point forming the largest
+    triangle with the previously kept point and the average of the next bucket.
+    
+    Args:
+        x: Sorted x coordinates as floats, without NaN
+        y: Y coordinates as floats, without NaN
+        n_out: Number of points to keep
+    
+    Returns:
+        Sorted indices of the kept points (all indices if n_out >= len(x))
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    
+    selected = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+            next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        # Twice the triangle area for every candidate in the bucket at once
+        ax, ay = x[selected], y[selected]
+        areas = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    
+    return indices
@@ -0,0 +1,247 @@
+"""
+Prompt cache for Gemini responses in the BI Intelligence Agent System.
+Serves repeated or near-identical prompts without another round-trip to the model.
+"""
+
+import asyncio
+import functools
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+from observability import observability
+
+
+class LLMCache:
+    """
+    Two-tier cache for LLM responses.
+    
+    The first tier is an exact match on a SHA-256 hash of the full request.
+    The second tier compares prompt embeddings with cosine similarity and
+    returns a stored response when a past prompt is close enough.
+    """
+    
+    def __init__(self, similarity_threshold: float = 0.92, max_entries: int = 512):
+        """
+        Initialize the cache.
+        
+        Args:
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum number of responses kept per tier
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._exact: Dict[str, str] = {}
+        # Semantic entries grouped by namespace: (unit-norm embeddings, responses)
+        self._semantic: Dict[str, Tuple[List[np.ndarray], List[str]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+    
+    @staticmethod
+    def namespace(model: str, temperature: float, system_instruction: str) -> str:
+        """Build the namespace key so model or temperature changes never share entries."""
+        raw = f"{model}\x00{temperature}\x00{system_instruction}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def exact_key(namespace: str, prompt: str) -> str:
+        """Build the exact-match key for a prompt within a namespace."""
+        return hashlib.sha256(f"{namespace}\x00{prompt}".encode("utf-8")).hexdigest()
+    
+    def get_exact(self, namespace: str, prompt: str) -> Optional[str]:
+        """Look up a response by exact request match."""
+        with self._lock:
+            response = self._exact.get(self.exact_key(namespace, prompt))
+            if response is not None:
+                self.stats["exact_hits"] += 1
+            return response
+    
+    def get_similar(self, namespace: str, embedding: Optional[List[float]]) -> Optional[str]:
+        """Look up a response whose prompt embedding is close to the given one."""
+        if embedding is None:
+            return None
+        
+        with self._lock:
+            entries = self._semantic.get(namespace)
+            if not entries or not entries[0]:
+                return None
+            vectors, responses = entries
+            query = self._normalize(embedding)
+            similarities = np.stack(vectors) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                self.stats["semantic_hits"] += 1
+                return responses[best]
+            return None
+    
+    def put(self, namespace: str, prompt: str, response: str,
+            embedding: Optional[List[float]] = None) -> None:
+        """Store a response in both tiers."""
+        with self._lock:
+            self.stats["misses"] += 1
+            if len(self._exact) >= self.max_entries:
+                self._exact.pop(next(iter(self._exact)))
+            self._exact[self.exact_key(namespace, prompt)] = response
+            
+            if embedding is not None:
+                vectors, responses = self._semantic.setdefault(namespace, ([], []))
+                if len(vectors) >= self.max_entries:
+                    vectors.pop(0)
+                    responses.pop(0)
+                vectors.append(self._normalize(embedding))
+                responses.append(response)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+
+def _is_cacheable(response: Any) -> bool:
+    """Only cache real model output, not fallback or error messages."""
+    return (
+        isinstance(response, str)
+        and bool(response)
+        and not response.startswith("Error generating response")
+        and not response.startswith("Unable to generate AI insights")
+        and not response.startswith("Analysis completed. Unable")
+    )
+
+
+def _embed(agent, prompt: str) -> Optional[List[float]]:
+    """Embed a prompt for the semantic tier; returns None if embedding fails."""
+    if not Config.LLM_CACHE_SEMANTIC:
+        return None
+    try:
+        result = agent.client.models.embed_content(model=Config.EMBEDDING_MODEL, contents=prompt)
+        return result.embeddings[0].values
+    except Exception as e:
+        observability.emit("warning", "llm_cache_embedding_failed", error=str(e))
+        return None
+
+
+async def _aembed(agent, prompt: str) -> Optional[List[float]]:
+    """Async version of _embed."""
+    if not Config.LLM_CACHE_SEMANTIC:
+        return None
+    try:
+        result = await agent.aio.models.embed_content(model=Config.EMBEDDING_MODEL, contents=prompt)
+        return result.embeddings[0].values
+    except Exception as e:
+        observability.emit("warning", "llm_cache_embedding_failed", error=str(e))
+        return None
+
+
+def _namespace(agent, context: Optional[Dict[str, Any]]) -> str:
+    """Build the cache namespace for an agent request."""
+    instruction = agent._build_system_instruction()
+    if context:
+        instruction = f"{instruction}\x00{context}"
+    return LLMCache.namespace(agent.model_name, Config.TEMPERATURE, instruction)
+
+
+def _log_hit(agent, tier: str) -> None:
+    """Log a cache hit."""
+    observability.emit("info", "llm_cache_hit", agent=agent.name, tier=tier)
+
+
+def lookup_cached(agent, prompt: str,
+                  context: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[List[float]]]:
+    """
+    Look up a cached response for an agent request.
+    
+    Args:
+        agent: BIAgent making the request
+        prompt: User prompt
+        context: Additional context for the prompt
+        
+    Returns:
+        Tuple of (cached response or None, prompt embedding to pass to store_cached)
+    """
+    if not Config.LLM_CACHE_ENABLED:
+        return None, None
+    
+    namespace = _namespace(agent, context)
+    cached = llm_cache.get_exact(namespace, prompt)
+    if cached is not None:
+        _log_hit(agent, "exact")
+        return cached, None
+    
+    embedding = _embed(agent, prompt)
+    cached = llm_cache.get_similar(namespace, embedding)
+    if cached is not None:
+        _log_hit(agent, "semantic")
+    return cached, embedding
+
+
+async def alookup_cached(agent, prompt: str,
+                         context: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[List[float]]]:
+    """Async version of lookup_cached."""
+    if not Config.LLM_CACHE_ENABLED:
+        return None, None
+    
+    namespace = _namespace(agent, context)
+    cached = llm_cache.get_exact(namespace, prompt)
+    if cached is not None:
+        _log_hit(agent, "exact")
+        return cached, None
+    
+    embedding = await _aembed(agent, prompt)
+    cached = llm_cache.get_similar(namespace, embedding)
+    if cached is not None:
+        _log_hit(agent, "semantic")
+    return cached, embedding
+
+
+def store_cached(agent, prompt: str, context: Optional[Dict[str, Any]], response: Any,
+                 embedding: Optional[List[float]] = None) -> None:
+    """Store a generated response, skipping fallback and error messages."""
+    if Config.LLM_CACHE_ENABLED and _is_cacheable(response):
+        llm_cache.put(_namespace(agent, context), prompt, response, embedding)
+
+
+def cached_generation(func: Callable) -> Callable:
+    """
+    Decorator that serves BIAgent generation calls from llm_cache.
+    
+    Works for both generate_response and agenerate_response.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+            cached, embedding = await alookup_cached(self, prompt, context)
+            if cached is not None:
+                return cached
+            
+            response = await func(self, prompt, context)
+            store_cached(self, prompt, context, response, embedding)
+            return response
+        
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        cached, embedding = lookup_cached(self, prompt, context)
+        if cached is not None:
+            return cached
+        
+        response = func(self, prompt, context)
+        store_cached(self, prompt, context, response, embedding)
+        return response
+    
+    return wrapper
+
+
+# Global cache instance shared by all agents
+llm_cache = LLMCache(similarity_threshold=Config.LLM_CACHE_SIMILARITY_THRESHOLD)
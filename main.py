@@ -8,10 +8,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from config import Config
-from agents import CoordinatorAgent
+from config import Config, ensure_ready
 from memory import MemoryBank
-from observability import observability
 
 
 def print_banner():
@@ -72,6 +70,10 @@ def analyze_command(args):
     print(f"\n🔍 Analyzing file: {args.file}")
     print("⚙️  Initializing agents...")
     
+    # Deferred so commands like list-sessions skip the agent stack
+    from agents import CoordinatorAgent
+    from observability import observability
+    
     # Initialize system
     memory_bank = MemoryBank()
     coordinator = CoordinatorAgent(memory_bank)
@@ -181,7 +183,7 @@ For more information, see README.md
     
     # Check if API key is configured
     try:
-        Config.validate()
+        ensure_ready()
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
         print("\n📝 Setup Instructions:")
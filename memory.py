@@ -3,16 +3,55 @@ Memory and session management for the BI Intelligence Agent System.
 Provides state persistence and context management across multiple analysis sessions.
 """
 
-import json
-import pickle
+import atexit
+import mmap
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from itertools import repeat
+import orjson
 from config import Config
+from observability import now_iso
 
 
-@dataclass
+def _read_json(path: Union[str, Path]) -> Any:
+    """Decode a JSON file with orjson straight from a read-only memory map."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")  # mmap cannot map an empty file; raise the usual decode error
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+# Human-readable files; numpy scalars and non-string keys are accepted like json.dump would
+_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Encode data with orjson and write it atomically.
+    
+    The bytes go to a sibling .tmp file that is then renamed over the target,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=_WRITE_OPTIONS))
+    os.replace(tmp_path, path)
+
+
+# dataclass(slots=True) needs Python 3.10; on 3.9 sessions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class AnalysisSession:
     """Represents an analysis session with its context and history."""
     
@@ -26,8 +65,8 @@ class AnalysisSession:
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert session to dictionary."""
-        return asdict(self)
+        """Convert session to a dictionary (shallow; nested values are already plain JSON types)."""
+        return {name: getattr(self, name) for name in _SESSION_FIELDS}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AnalysisSession':
@@ -35,12 +74,50 @@ class AnalysisSession:
         return cls(**data)
 
 
+_SESSION_FIELDS = tuple(f.name for f in fields(AnalysisSession))
+
+# Session lists stored as append-only events: (event type, AnalysisSession field)
+_SESSION_EVENT_FIELDS = (
+    ("analysis", "analysis_history"),
+    ("insight", "insights"),
+    ("visualization", "visualizations"),
+)
+_SESSION_HEADER_FIELDS = tuple(
+    name for name in _SESSION_FIELDS
+    if name not in {field_name for _, field_name in _SESSION_EVENT_FIELDS}
+)
+_EVENT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+@dataclass
+class AnalysisResult:
+    """Typed result of a dataset analysis run by the Data Analyst agent."""
+    
+    __slots__ = ("timestamp", "correlation_analysis", "outlier_analysis", "ai_insights")
+    
+    timestamp: str
+    correlation_analysis: Dict[str, Any]
+    outlier_analysis: List[Dict[str, Any]]
+    ai_insights: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to a dictionary (shallow, for JSON boundaries)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style access for callers that still treat results as dicts."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+
 class MemoryBank:
     """
     Long-term memory storage for analysis sessions and learned patterns.
     Maintains context across multiple sessions for improved analysis.
     """
     
+    # Recently saved or loaded sessions kept in memory (least recently used evicted first)
+    SESSION_CACHE_SIZE = 32
+    
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize the memory bank.
@@ -53,29 +130,46 @@ class MemoryBank:
         self.sessions_path = self.storage_path / "sessions"
         self.sessions_path.mkdir(exist_ok=True)
         self.insights_path = self.storage_path / "insights.json"
+        # One line per session save (last line wins), so listing never opens session files
+        self.index_path = self.storage_path / "sessions_index.jsonl"
         self.patterns_path = self.storage_path / "patterns.json"
         
         # Load existing insights and patterns
         self.global_insights = self._load_insights()
         self.learned_patterns = self._load_patterns()
+        
+        # Sessions changed since their last write, flushed by a background thread
+        self._dirty: Dict[str, AnalysisSession] = {}
+        self._dirty_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        
+        # Global insights and patterns changed since their last write, flushed with sessions
+        self._insights_dirty = False
+        self._patterns_dirty = False
+        
+        # Per session, the (list, length) of each event field as last written to disk
+        self._persisted: Dict[str, Tuple[Tuple[list, int], ...]] = {}
+        
+        # session_id -> (header file mtime_ns, session); stale once the file changes
+        self._session_cache: "OrderedDict[str, Tuple[int, AnalysisSession]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _load_insights(self) -> List[str]:
         """Load global insights from storage."""
         if self.insights_path.exists():
-            with open(self.insights_path, 'r') as f:
-                return json.load(f)
+            return _read_json(self.insights_path)
         return []
     
     def _save_insights(self) -> None:
         """Save global insights to storage."""
-        with open(self.insights_path, 'w') as f:
-            json.dump(self.global_insights, f, indent=2)
+        with self._write_lock:
+            _write_json(self.insights_path, self.global_insights)
     
     def _load_patterns(self) -> Dict[str, Any]:
         """Load learned patterns from storage."""
         if self.patterns_path.exists():
-            with open(self.patterns_path, 'r') as f:
-                return json.load(f)
+            return _read_json(self.patterns_path)
         return {
             "common_columns": {},
             "typical_ranges": {},
@@ -84,8 +178,8 @@ class MemoryBank:
     
     def _save_patterns(self) -> None:
         """Save learned patterns to storage."""
-        with open(self.patterns_path, 'w') as f:
-            json.dump(self.learned_patterns, f, indent=2)
+        with self._write_lock:
+            _write_json(self.patterns_path, self.learned_patterns)
     
     def create_session(self, dataset_info: Optional[Dict[str, Any]] = None) -> AnalysisSession:
         """
@@ -97,8 +191,9 @@ class MemoryBank:
         Returns:
             New AnalysisSession object
         """
-        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        timestamp = datetime.now().isoformat()
+        # Microseconds keep IDs unique when analyses start in the same second
+        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        timestamp = now_iso()
         
         session = AnalysisSession(
             session_id=session_id,
@@ -114,14 +209,201 @@ class MemoryBank:
         """
         Save a session to persistent storage.
         
+        The small header (IDs, timestamps, dataset info, metadata) is rewritten;
+        history, insights and visualizations added since the last save are
+        appended to the session's events file.
+        
         Args:
             session: Session to save
         """
-        session.last_updated = datetime.now().isoformat()
+        with self._dirty_lock:
+            self._dirty.pop(session.session_id, None)
+        
+        session.last_updated = now_iso()
         session_file = self.sessions_path / f"{session.session_id}.json"
+        header = {name: getattr(session, name) for name in _SESSION_HEADER_FIELDS}
         
-        with open(session_file, 'w') as f:
-            json.dump(session.to_dict(), f, indent=2)
+        with self._write_lock:
+            self._append_events(session)
+            _write_json(session_file, header)
+            self._update_index(header)
+            self._cache_session(session, os.stat(session_file).st_mtime_ns)
+    
+    def _cache_session(self, session: AnalysisSession, mtime_ns: int) -> None:
+        """Remember a session as of its header file's modification time."""
+        with self._cache_lock:
+            self._session_cache[session.session_id] = (mtime_ns, session)
+            self._session_cache.move_to_end(session.session_id)
+            if len(self._session_cache) > self.SESSION_CACHE_SIZE:
+                self._session_cache.popitem(last=False)
+    
+    def _append_events(self, session: AnalysisSession) -> None:
+        """
+        Write list entries added since the last save to the events file.
+        
+        The file is rewritten from scratch for sessions this bank has not saved
+        or loaded yet, and when a list was replaced or shrunk. Callers hold _write_lock.
+        
+        Args:
+            session: Session being saved
+        """
+        lists = [getattr(session, name) for _, name in _SESSION_EVENT_FIELDS]
+        counts = [len(entries) for entries in lists]
+        persisted = self._persisted.get(session.session_id)
+        rewrite = persisted is None or any(
+            entries is not saved or count < saved_count
+            for entries, count, (saved, saved_count) in zip(lists, counts, persisted)
+        )
+        
+        lines = []
+        for (event_type, _), entries, count, (_, saved_count) in zip(
+                _SESSION_EVENT_FIELDS, lists, counts, repeat((None, 0)) if rewrite else persisted):
+            for entry in entries[saved_count:count]:
+                lines.append(orjson.dumps({"type": event_type, "value": entry}, option=_EVENT_OPTIONS))
+                lines.append(b"\n")
+        
+        if lines or rewrite:
+            events_file = self.sessions_path / f"{session.session_id}.events.jsonl"
+            with open(events_file, 'wb' if rewrite else 'ab') as f:
+                f.write(b"".join(lines))
+        
+        self._persisted[session.session_id] = tuple(zip(lists, counts))
+    
+    @staticmethod
+    def _index_entry(header: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the index entry for a session header."""
+        dataset_info = header.get("dataset_info") or {}
+        return {
+            "session_id": header["session_id"],
+            "created_at": header["created_at"],
+            "last_updated": header["last_updated"],
+            "dataset": dataset_info.get("name", "Unknown"),
+            "columns": dataset_info.get("columns", [])
+        }
+    
+    def _update_index(self, header: Dict[str, Any]) -> None:
+        """Record a saved session in the index. Callers hold _write_lock."""
+        if not self.index_path.exists():
+            # First save with this index: build it from the session headers on disk
+            self._write_index(self._scan_session_headers())
+            return
+        
+        with open(self.index_path, 'ab') as f:
+            f.write(orjson.dumps(self._index_entry(header), option=_EVENT_OPTIONS) + b"\n")
+    
+    def _scan_session_headers(self) -> Dict[str, Dict[str, Any]]:
+        """Build index entries by reading every session header file."""
+        entries = {}
+        with os.scandir(self.sessions_path) as files:
+            for entry in files:
+                if entry.name.startswith("session_") and entry.name.endswith(".json"):
+                    try:
+                        index_entry = self._index_entry(_read_json(entry.path))
+                    except Exception:
+                        # Skip problematic session files
+                        continue
+                    entries[index_entry["session_id"]] = index_entry
+        return entries
+    
+    def _write_index(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the index with one line per session. Callers hold _write_lock."""
+        tmp_path = self.index_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(b"".join(
+                orjson.dumps(entry, option=_EVENT_OPTIONS) + b"\n" for entry in entries.values()
+            ))
+        os.replace(tmp_path, self.index_path)
+    
+    def _parse_index(self) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Read the index file; returns (latest entry per session, number of lines)."""
+        entries = {}
+        lines = 0
+        with open(self.index_path, 'rb') as f:
+            for line in f:
+                lines += 1
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A partially written last line from an interrupted append
+                    continue
+                entries[entry["session_id"]] = entry
+        return entries, lines
+    
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the session index, building or compacting it when needed.
+        
+        Returns:
+            Index entry per session ID
+        """
+        if not self.index_path.exists():
+            with self._write_lock:
+                if not self.index_path.exists():
+                    self._write_index(self._scan_session_headers())
+        
+        entries, lines = self._parse_index()
+        if lines > 2 * len(entries) + 64:
+            # Mostly superseded lines: rewrite with the latest entry per session
+            with self._write_lock:
+                entries, _ = self._parse_index()
+                self._write_index(entries)
+        return entries
+    
+    def mark_dirty(self, session: AnalysisSession) -> None:
+        """
+        Schedule a session to be written by the background flusher.
+        
+        Repeated changes within one flush interval are coalesced into a single write.
+        
+        Args:
+            session: Session that has changed
+        """
+        with self._dirty_lock:
+            self._dirty[session.session_id] = session
+        
+        if self._flusher is None:
+            self._start_flusher()
+    
+    def flush_sessions(self) -> None:
+        """Write every dirty session, and changed global insights and patterns, now."""
+        with self._dirty_lock:
+            dirty = list(self._dirty.values())
+            save_insights, self._insights_dirty = self._insights_dirty, False
+            save_patterns, self._patterns_dirty = self._patterns_dirty, False
+        
+        try:
+            if save_insights:
+                self._save_insights()
+                save_insights = False
+            if save_patterns:
+                self._save_patterns()
+        except Exception:
+            # Keep them dirty so the next flush retries the write
+            with self._dirty_lock:
+                self._insights_dirty |= save_insights
+                self._patterns_dirty |= save_patterns
+        
+        for session in dirty:
+            try:
+                self.save_session(session)
+            except Exception:
+                # Keep it dirty so the next flush retries the write
+                self.mark_dirty(session)
+    
+    def _start_flusher(self) -> None:
+        """Start the background thread that writes dirty sessions, insights and patterns."""
+        with self._dirty_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="session-flusher", daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush_sessions)
+    
+    def _flush_loop(self) -> None:
+        """Flush dirty sessions every SESSION_FLUSH_INTERVAL seconds."""
+        while True:
+            time.sleep(Config.SESSION_FLUSH_INTERVAL)
+            self.flush_sessions()
     
     def load_session(self, session_id: str) -> Optional[AnalysisSession]:
         """
@@ -135,12 +417,40 @@ class MemoryBank:
         """
         session_file = self.sessions_path / f"{session_id}.json"
         
-        if not session_file.exists():
+        try:
+            mtime_ns = os.stat(session_file).st_mtime_ns
+        except FileNotFoundError:
             return None
         
-        with open(session_file, 'r') as f:
-            data = json.load(f)
-            return AnalysisSession.from_dict(data)
+        # Served from memory unless the file was rewritten since (e.g. by another process)
+        with self._cache_lock:
+            cached = self._session_cache.get(session_id)
+            if cached is not None and cached[0] == mtime_ns:
+                self._session_cache.move_to_end(session_id)
+                return cached[1]
+        
+        # Sessions saved before the events file existed keep their lists in the header
+        session = AnalysisSession.from_dict(_read_json(session_file))
+        
+        events_file = self.sessions_path / f"{session_id}.events.jsonl"
+        if events_file.exists():
+            lists = {event_type: getattr(session, name) for event_type, name in _SESSION_EVENT_FIELDS}
+            with open(events_file, 'rb') as f:
+                for line in f:
+                    try:
+                        event = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A partially written last line from an interrupted append
+                        continue
+                    lists[event["type"]].append(event["value"])
+            
+            with self._write_lock:
+                self._persisted[session_id] = tuple(
+                    (entries, len(entries)) for entries in lists.values()
+                )
+        
+        self._cache_session(session, mtime_ns)
+        return session
     
     def list_sessions(self) -> List[Dict[str, Any]]:
         """
@@ -149,21 +459,20 @@ class MemoryBank:
         Returns:
             List of session summaries
         """
-        sessions = []
-        for session_file in self.sessions_path.glob("session_*.json"):
-            with open(session_file, 'r') as f:
-                data = json.load(f)
-                sessions.append({
-                    "session_id": data["session_id"],
-                    "created_at": data["created_at"],
-                    "last_updated": data["last_updated"],
-                    "dataset": data.get("dataset_info", {}).get("name", "Unknown")
-                })
+        sessions = [
+            {
+                "session_id": entry["session_id"],
+                "created_at": entry["created_at"],
+                "last_updated": entry["last_updated"],
+                "dataset": entry["dataset"]
+            }
+            for entry in self._read_index().values()
+        ]
         
         return sorted(sessions, key=lambda x: x["last_updated"], reverse=True)
     
     def add_analysis_result(self, session: AnalysisSession, 
-                           analysis_type: str, result: Dict[str, Any]) -> None:
+                           analysis_type: str, result: Union[Dict[str, Any], AnalysisResult]) -> None:
         """
         Add an analysis result to the session history.
         
@@ -172,12 +481,15 @@ class MemoryBank:
             analysis_type: Type of analysis performed
             result: Analysis results
         """
+        if isinstance(result, AnalysisResult):
+            result = result.to_dict()
+        
         session.analysis_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "analysis_type": analysis_type,
             "result": result
         })
-        self.save_session(session)
+        self.mark_dirty(session)
     
     def add_insight(self, session: AnalysisSession, insight: str, 
                    is_global: bool = False) -> None:
@@ -193,9 +505,9 @@ class MemoryBank:
         
         if is_global and insight not in self.global_insights:
             self.global_insights.append(insight)
-            self._save_insights()
+            self._insights_dirty = True
         
-        self.save_session(session)
+        self.mark_dirty(session)
     
     def add_visualization(self, session: AnalysisSession, viz_path: str) -> None:
         """
@@ -206,7 +518,7 @@ class MemoryBank:
             viz_path: Path to the visualization file
         """
         session.visualizations.append(viz_path)
-        self.save_session(session)
+        self.mark_dirty(session)
     
     def learn_pattern(self, pattern_type: str, pattern_data: Dict[str, Any]) -> None:
         """
@@ -220,11 +532,14 @@ class MemoryBank:
             self.learned_patterns[pattern_type] = []
         
         self.learned_patterns[pattern_type].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "data": pattern_data
         })
         
-        self._save_patterns()
+        # Written by the background flusher, coalesced with other changes
+        self._patterns_dirty = True
+        if self._flusher is None:
+            self._start_flusher()
     
     def get_relevant_context(self, dataset_columns: List[str]) -> Dict[str, Any]:
         """
@@ -242,34 +557,23 @@ class MemoryBank:
             "suggested_analyses": []
         }
         
-        # Ensure dataset_columns is a list
-        if not isinstance(dataset_columns, list):
-            dataset_columns = list(dataset_columns) if dataset_columns else []
-        
-        # Find similar past analyses
-        for session_file in self.sessions_path.glob("session_*.json"):
+        # Find similar past analyses (Jaccard similarity of column sets)
+        query_columns = set(dataset_columns) if dataset_columns is not None else set()
+        for data in self._read_index().values() if query_columns else ():
             try:
-                with open(session_file, 'r') as f:
-                    data = json.load(f)
-                    past_columns = data.get("dataset_info", {}).get("columns", [])
-                    
-                    # Ensure past_columns is a list
-                    if not isinstance(past_columns, list):
-                        past_columns = list(past_columns) if past_columns else []
-                    
-                    # Calculate similarity based on common columns
-                    if dataset_columns and past_columns:
-                        common_cols = set(dataset_columns) & set(past_columns)
-                        if len(common_cols) > 0:
-                            similarity = len(common_cols) / len(set(dataset_columns) | set(past_columns))
-                            if similarity > 0.3:  # 30% similarity threshold
-                                context["similar_analyses"].append({
-                                    "session_id": data["session_id"],
-                                    "similarity": similarity,
-                                    "common_columns": list(common_cols)
-                                })
+                past_columns = set(data["columns"] or ())
+                common_cols = query_columns.intersection(past_columns)
+                if common_cols:
+                    # |A ∪ B| = |A| + |B| - |A ∩ B|, without building the union
+                    similarity = len(common_cols) / (len(query_columns) + len(past_columns) - len(common_cols))
+                    if similarity > 0.3:  # 30% similarity threshold
+                        context["similar_analyses"].append({
+                            "session_id": data["session_id"],
+                            "similarity": similarity,
+                            "common_columns": list(common_cols)
+                        })
             except Exception as e:
-                # Skip problematic session files
+                # Skip problematic index entries
                 continue
         
         # Add relevant global insights
@@ -338,7 +642,7 @@ class InMemorySessionService:
     
     def persist_session(self, session_id: str) -> None:
         """
-        Persist a session to the memory bank.
+        Persist a session to the memory bank, including any pending write-behind changes.
         
         Args:
             session_id: Session to persist
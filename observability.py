@@ -3,40 +3,109 @@ Observability module for logging, tracing, and monitoring agent activities.
 Provides structured logging and performance tracking for the BI Intelligence Agent System.
 """
 
-import structlog
+import atexit
+import queue
+import sys
+import threading
 import time
 import functools
 from typing import Any, Callable, Dict, Optional
-from datetime import datetime
 from pathlib import Path
 from config import Config
 
 
+class _IsoClock:
+    """Formats epoch times as ISO 8601, reformatting the date and time part only once per second."""
+    
+    def __init__(self, utc: bool):
+        self._convert = time.gmtime if utc else time.localtime
+        self._suffix = "Z" if utc else ""
+        self._cached = (None, "")  # (whole second, formatted prefix), swapped atomically
+    
+    def format(self, t: float) -> str:
+        second = int(t)
+        cached_second, prefix = self._cached
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", self._convert(second))
+            self._cached = (second, prefix)
+        return f"{prefix}.{int((t - second) * 1e6):06d}{self._suffix}"
+
+
+_local_clock = _IsoClock(utc=False)
+_utc_clock = _IsoClock(utc=True)
+
+
+def now_iso() -> str:
+    """Current local time in ISO 8601 format, like datetime.now().isoformat()."""
+    return _local_clock.format(time.time())
+
+
+def _add_timestamp(logger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """structlog processor: stamp events that were not stamped when emitted."""
+    if "timestamp" not in event_dict:
+        event_dict["timestamp"] = _utc_clock.format(time.time())
+    return event_dict
+
+
+def _render_diagnostics(logger, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """structlog processor: render stack and exception info only for events that ask for it."""
+    if event_dict.get("stack_info"):
+        from structlog.processors import StackInfoRenderer
+        event_dict = StackInfoRenderer()(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        from structlog.processors import format_exc_info
+        event_dict = format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
 class ObservabilityManager:
     """Manages logging and tracing for agent operations."""
     
-    def __init__(self):
-        """Initialize the observability manager with structured logging."""
+    # Events written per wake-up of the log writer thread
+    WRITE_BATCH_SIZE = 64
+    
+    # Traced tool calls log one event per this many successful calls (failures always log)
+    TOOL_LOG_SAMPLE_EVERY = 100
+    
+    def __init__(self, queue_size: int = 10000):
+        """
+        Initialize the observability manager with structured logging.
+        
+        Args:
+            queue_size: Maximum number of log events waiting to be written
+        """
+        import structlog  # deferred so importing this module stays cheap
+        
         self.setup_logging()
         self.metrics: Dict[str, Any] = {
             "agent_calls": 0,
             "tool_executions": 0,
             "errors": 0,
-            "total_processing_time": 0.0
+            "total_processing_time": 0.0,
+            "dropped_log_events": 0
         }
         self.logger = structlog.get_logger()
+        
+        # Per-tool [calls, total seconds] from traced executions
+        self.tool_stats: Dict[str, list] = {}
+        
+        # Log events are rendered and written by a background thread (started on first emit)
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
     
     def setup_logging(self) -> None:
         """Configure structured logging with appropriate processors."""
+        import structlog
+        
         structlog.configure(
             processors=[
                 structlog.stdlib.filter_by_level,
                 structlog.stdlib.add_logger_name,
                 structlog.stdlib.add_log_level,
                 structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
+                _add_timestamp,
+                _render_diagnostics,
                 structlog.processors.UnicodeDecoder(),
                 structlog.processors.JSONRenderer()
             ],
@@ -45,14 +114,69 @@ class ObservabilityManager:
             cache_logger_on_first_use=True,
         )
     
+    def emit(self, level: str, event: str, **kwargs) -> None:
+        """
+        Queue a log event without blocking on serialization or I/O.
+        
+        Args:
+            level: Log method name ("info", "warning", "error", ...)
+            event: Event name
+            **kwargs: Event fields
+        """
+        if self._writer is None:
+            self._start_writer()
+        if kwargs.get("exc_info") is True:
+            # The writer thread has no active exception; capture it here
+            kwargs["exc_info"] = sys.exc_info()
+        try:
+            # The emit time is captured here; formatting happens on the writer thread
+            self._queue.put_nowait((level, event, kwargs, time.time()))
+        except queue.Full:
+            self.metrics["dropped_log_events"] += 1
+    
+    def flush(self) -> None:
+        """Block until every queued log event has been written."""
+        if self._writer is not None:
+            self._queue.join()
+    
+    def _start_writer(self) -> None:
+        """Start the background thread that writes queued log events."""
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(target=self._drain, name="observability-writer", daemon=True)
+            self._writer.start()
+            # atexit runs in reverse order: summarize first, then drain the queue
+            atexit.register(self.flush)
+            atexit.register(self.log_metrics_summary)
+    
+    def _drain(self) -> None:
+        """Write queued log events in batches of up to WRITE_BATCH_SIZE."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for level, event, fields, emitted_at in batch:
+                try:
+                    fields.setdefault("timestamp", _utc_clock.format(emitted_at))
+                    getattr(self.logger, level)(event, **fields)
+                except Exception:
+                    pass
+                finally:
+                    self._queue.task_done()
+    
     def log_agent_call(self, agent_name: str, task: str, **kwargs) -> None:
         """Log an agent invocation."""
         self.metrics["agent_calls"] += 1
-        self.logger.info(
+        self.emit(
+            "info",
             "agent_call",
             agent_name=agent_name,
             task=task,
-            timestamp=datetime.now().isoformat(),
             **kwargs
         )
     
@@ -64,23 +188,51 @@ class ObservabilityManager:
         if not success:
             self.metrics["errors"] += 1
         
-        self.logger.info(
+        self.emit(
+            "info",
             "tool_execution",
             tool_name=tool_name,
             duration_seconds=duration,
             success=success,
-            timestamp=datetime.now().isoformat(),
             **kwargs
         )
     
+    def record_tool_execution(self, tool_name: str, duration: float, success: bool,
+                              error: Optional[str] = None) -> None:
+        """
+        Record a traced tool execution, logging only failures and sampled successes.
+        
+        Args:
+            tool_name: Name of the tool function
+            duration: Execution time in seconds
+            success: Whether the call completed without raising
+            error: Error message for failed calls
+        """
+        self.metrics["tool_executions"] += 1
+        self.metrics["total_processing_time"] += duration
+        
+        stats = self.tool_stats.get(tool_name)
+        if stats is None:
+            stats = self.tool_stats[tool_name] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += duration
+        
+        if not success:
+            self.metrics["errors"] += 1
+            self.emit("info", "tool_execution", tool_name=tool_name, duration_seconds=duration,
+                      success=False, error=error)
+        elif stats[0] % self.TOOL_LOG_SAMPLE_EVERY == 1:
+            self.emit("info", "tool_execution", tool_name=tool_name, duration_seconds=duration,
+                      success=True, calls=stats[0])
+    
     def log_error(self, error_type: str, message: str, **kwargs) -> None:
         """Log an error occurrence."""
         self.metrics["errors"] += 1
-        self.logger.error(
+        self.emit(
+            "error",
             "error_occurred",
             error_type=error_type,
             message=message,
-            timestamp=datetime.now().isoformat(),
             **kwargs
         )
     
@@ -101,41 +253,50 @@ class ObservabilityManager:
     def log_metrics_summary(self) -> None:
         """Log a summary of collected metrics."""
         metrics = self.get_metrics()
-        self.logger.info("metrics_summary", **metrics)
+        tools = {
+            name: {"calls": calls, "total_seconds": total}
+            for name, (calls, total) in self.tool_stats.items()
+        }
+        self.emit("info", "metrics_summary", tools=tools, **metrics)
 
 
 def trace_execution(func: Callable) -> Callable:
-    """Decorator to trace function execution time and log it."""
-    @functools.wraps(func)
+    """Decorator to trace function execution time and record it."""
+    tool_name = func.__name__
+    
+    @functools.wraps(func, updated=())
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        success = True
-        result = None
-        error = None
+        obs = getattr(args[0], 'observability', None) if args else None
+        if obs is None:
+            return func(*args, **kwargs)
         
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            return result
         except Exception as e:
-            success = False
-            error = str(e)
+            obs.record_tool_execution(tool_name, time.perf_counter() - start_time, False, str(e))
             raise
-        finally:
-            duration = time.time() - start_time
-            
-            # Get observability manager if available
-            if hasattr(args[0], 'observability'):
-                obs = args[0].observability
-                obs.log_tool_execution(
-                    tool_name=func.__name__,
-                    duration=duration,
-                    success=success,
-                    error=error
-                )
+        obs.record_tool_execution(tool_name, time.perf_counter() - start_time, True)
+        return result
     
     return wrapper
 
 
-# Global observability instance
-observability = ObservabilityManager()
+_instance_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the global observability instance on first access.
+    
+    Modules that only need helpers such as now_iso() then never import
+    structlog or configure logging.
+    """
+    if name == "observability":
+        with _instance_lock:
+            instance = globals().get("observability")
+            if instance is None:
+                instance = globals()["observability"] = ObservabilityManager()
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
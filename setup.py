@@ -3,12 +3,28 @@ Setup script to help users configure the BI Intelligence Agent System.
 Guides through installation and configuration process.
 """
 
+import importlib.metadata
+import importlib.util
 import os
+import re
 import sys
 import subprocess
 from pathlib import Path
 
 
+# Packages verify_setup checks for
+REQUIRED_PACKAGES = ("pandas", "numpy", "matplotlib", "google.genai")
+
+
+def _is_installed(name):
+    """Check whether a package can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # The parent of a dotted name (e.g. google) is missing
+        return False
+
+
 def print_header(text):
     """Print a formatted header."""
     print("\n" + "="*70)
@@ -39,14 +55,54 @@ def check_python_version():
         return False
 
 
+def missing_requirements(requirements_file="requirements.txt"):
+    """
+    List the requirement lines that are not installed or whose installed version is out of range.
+    
+    Checks installed package metadata by distribution name (so scikit-learn and
+    google-genai need no import-name mapping). Version pins are compared with
+    packaging; without it (a bare interpreter) only presence is checked.
+    """
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+    
+    missing = []
+    for line in Path(requirements_file).read_text(encoding="utf-8").splitlines():
+        requirement = line.split("#", 1)[0].strip()
+        if not requirement:
+            continue
+        if Requirement is None:
+            name, specifier = re.split(r"[<>=!~;\[\s]", requirement, maxsplit=1)[0], None
+        else:
+            parsed = Requirement(requirement)
+            if parsed.marker is not None and not parsed.marker.evaluate():
+                continue
+            name, specifier = parsed.name, parsed.specifier
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(requirement)
+            continue
+        if specifier is not None and not specifier.contains(version, prereleases=True):
+            missing.append(requirement)
+    return missing
+
+
 def install_dependencies():
     """Install required Python packages."""
     print_step(2, "Installing Dependencies")
     
+    missing = missing_requirements()
+    if not missing:
+        print("✅ All dependencies are already installed")
+        return True
+    
     try:
-        print("Installing packages from requirements.txt...")
+        print(f"Installing {len(missing)} missing or outdated package(s) from requirements.txt...")
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
+            sys.executable, "-m", "pip", "install", *missing
         ])
         print("\n✅ All dependencies installed successfully")
         return True
@@ -174,18 +230,14 @@ def verify_setup():
         print("❌ Sample data files not found")
         checks.append(False)
     
-    # Check required modules can be imported
-    try:
-        import pandas
-        import numpy
-        import matplotlib
-        import seaborn
-        from google import genai
+    # Check required modules can be imported (locate them without loading them)
+    missing = [name for name in REQUIRED_PACKAGES if not _is_installed(name)]
+    if missing:
+        print(f"❌ Missing package: {', '.join(missing)}")
+        checks.append(False)
+    else:
         print("✅ All required packages are importable")
         checks.append(True)
-    except ImportError as e:
-        print(f"❌ Missing package: {e}")
-        checks.append(False)
     
     return all(checks)
 
@@ -0,0 +1,29 @@
+"""
+Regression checks for the agent entry points in agents.py.
+Run with pytest; no Gemini calls are made.
+"""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from agents import CoordinatorAgent
+from memory import MemoryBank
+
+
+def test_analyze_file_inside_running_loop():
+    """analyze_file works from a running event loop, as in a notebook cell."""
+    with tempfile.TemporaryDirectory() as storage:
+        coordinator = CoordinatorAgent(MemoryBank(Path(storage)))
+
+        async def notebook_cell():
+            return coordinator.analyze_file(str(Path(storage) / "missing.csv"))
+
+        results = asyncio.run(notebook_cell())
+        coordinator.memory_bank.flush_sessions()
+
+    assert results["success"] is False
+    assert "not found" in results["error"]
@@ -0,0 +1,44 @@
+"""
+Regression checks for the numeric kernels in kernels.py.
+Run with pytest.
+"""
+
+import numpy as np
+import pandas as pd
+
+from kernels import correlation_matrix, float32_block
+
+
+def test_constant_columns_match_pandas():
+    """Constant columns correlate as NaN at every row count, like df.corr()."""
+    rng = np.random.default_rng(0)
+    for n in (3, 7, 10, 30, 50, 100, 1000, 12345):
+        block = np.column_stack([rng.random(n), np.full(n, 0.1), np.full(n, 0.7)])
+        for dtype in (np.float64, np.float32):
+            typed = block.astype(dtype)
+            expected = pd.DataFrame(typed).corr().to_numpy()
+            np.testing.assert_allclose(correlation_matrix(typed), expected,
+                                       rtol=1e-5, atol=1e-6, equal_nan=True)
+
+
+def test_varying_columns_match_pandas():
+    """Ordinary columns agree with pandas' Pearson correlation."""
+    rng = np.random.default_rng(1)
+    base = rng.random(500)
+    block = np.column_stack([base, 2 * base + rng.random(500), -base, rng.random(500)])
+    expected = pd.DataFrame(block).corr().to_numpy()
+    np.testing.assert_allclose(correlation_matrix(block), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_float32_block_keeps_precision():
+    """Columns float32 cannot resolve (large values, small range) stay float64."""
+    rng = np.random.default_rng(2)
+    small = pd.DataFrame({"x": rng.random(100), "y": rng.normal(50, 10, 100)})
+    assert float32_block(small)[1].dtype == np.float32
+    
+    stamps = small.assign(t=1.7e9 + np.arange(100.0))
+    _, block = float32_block(stamps)
+    assert block.dtype == np.float64
+    np.testing.assert_array_equal(block[:, 2], stamps["t"].to_numpy())
+    
+    assert float32_block(small.assign(big=[1e39] + [0.0] * 99))[1].dtype == np.float64
@@ -5,19 +5,277 @@ These tools provide capabilities for data ingestion, statistical analysis, and r
 
 import pandas as pd
 import numpy as np
-import json
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
+import base64
+import copy
+import functools
+import html
+import inspect
+import io
+import mimetypes
+import string
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
+import orjson
 from datetime import datetime
-from scipy import stats
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
 from config import Config
 from observability import trace_execution, observability
+from kernels import float32_block, correlation_matrix, iqr_outlier_stats, lttb_indices
+
+
+# Analysis JSON in the report: indented, with NumPy values and non-string keys (e.g. unnamed columns)
+_REPORT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Report sections around the streamed insights, images and analysis JSON.
+# _REPORT_HEADER is parsed once at import; only its four fields vary per report.
+_REPORT_HEADER = string.Template("""
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Business Intelligence Analysis Report</title>
+            <style>
+                body {
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    line-height: 1.6;
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    background-color: #f5f5f5;
+                }
+                .header {
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    color: white;
+                    padding: 30px;
+                    border-radius: 10px;
+                    margin-bottom: 30px;
+                }
+                .header h1 {
+                    margin: 0;
+                    font-size: 2.5em;
+                }
+                .section {
+                    background: white;
+                    padding: 25px;
+                    margin-bottom: 20px;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                }
+                .section h2 {
+                    color: #667eea;
+                    border-bottom: 2px solid #667eea;
+                    padding-bottom: 10px;
+                }
+                .insight {
+                    background: #f0f4ff;
+                    padding: 15px;
+                    margin: 10px 0;
+                    border-left: 4px solid #667eea;
+                    border-radius: 4px;
+                }
+                .metric {
+                    display: inline-block;
+                    background: #e8f4f8;
+                    padding: 10px 20px;
+                    margin: 5px;
+                    border-radius: 5px;
+                }
+                .visualization {
+                    max-width: 100%;
+                    height: auto;
+                    margin: 15px 0;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+                }
+                table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 15px 0;
+                }
+                th, td {
+                    padding: 12px;
+                    text-align: left;
+                    border-bottom: 1px solid #ddd;
+                }
+                th {
+                    background-color: #667eea;
+                    color: white;
+                }
+                tr:hover {
+                    background-color: #f5f5f5;
+                }
+                .footer {
+                    text-align: center;
+                    padding: 20px;
+                    color: #666;
+                    font-size: 0.9em;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>📊 Business Intelligence Analysis Report</h1>
+                <p>Generated: ${timestamp}</p>
+            </div>
+            
+            <div class="section">
+                <h2>📈 Data Summary</h2>
+                <div class="metric"><strong>Rows:</strong> ${rows}</div>
+                <div class="metric"><strong>Columns:</strong> ${columns}</div>
+                <div class="metric"><strong>Memory:</strong> ${memory}</div>
+            </div>
+            
+            <div class="section">
+                <h2>💡 Key Insights</h2>
+                """)
+
+_REPORT_VISUALIZATIONS = """
+            </div>
+            
+            <div class="section">
+                <h2>📊 Visualizations</h2>
+                """
+
+_REPORT_ANALYSIS = """
+            </div>
+            
+            <div class="section">
+                <h2>🔍 Detailed Analysis</h2>
+                <pre style="background: #f5f5f5; padding: 15px; border-radius: 5px; overflow-x: auto;">
+"""
+
+_REPORT_FOOTER = """
+                </pre>
+            </div>
+            
+            <div class="footer">
+                <p>Generated by BI Intelligence Agent System | Powered by Google Gemini</p>
+            </div>
+        </body>
+        </html>
+        """
+
+
+def _file_stamp() -> str:
+    """Timestamp for output file names, with microseconds so concurrent runs never collide."""
+    return datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+
+
+def _save_png(fig, output_path: Path) -> None:
+    """
+    Render a laid-out figure once and write it as a PNG.
+    
+    Uses a fast zlib setting (slightly larger files, much quicker encoding) and
+    no tight bbox, which would render the figure a second time to measure it.
+    
+    Args:
+        fig: Matplotlib figure, created at its output DPI
+        output_path: Path of the PNG to write
+    """
+    fig.savefig(output_path, format='png', pil_kwargs={"compress_level": 1, "optimize": False})
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_output_dirs() -> None:
+    """Create the chart and report directories once per process, not per tool instance."""
+    Config.OUTPUT_DIR.mkdir(exist_ok=True)
+    Config.REPORTS_DIR.mkdir(exist_ok=True)
+
+
+def _new_figure(**kwargs):
+    """
+    Create a standalone figure that is never registered with pyplot.
+    
+    pyplot keeps a process-wide registry of open figures and a current figure,
+    which concurrent renders would share; a bare Figure holds no global state
+    and is freed as soon as it goes out of scope.
+    
+    Args:
+        **kwargs: Figure options such as figsize and dpi
+        
+    Returns:
+        New matplotlib Figure
+    """
+    # Plotting libraries load on first use so importing tools stays cheap
+    import matplotlib
+    from matplotlib.figure import Figure
+    
+    # Resolve the backend up front; otherwise the first rcParams lookup of it
+    # (e.g. inside boxplot) imports pyplot to pick an interactive one
+    matplotlib.use("Agg")
+    return Figure(**kwargs)
+
+
+def _image_src(path: Union[str, Path]) -> str:
+    """
+    Build an <img> src for a report image, inlined as a base64 data URI.
+    
+    Falls back to the escaped file path when the image cannot be read.
+    
+    Args:
+        path: Path to the image file
+        
+    Returns:
+        Value for the src attribute
+    """
+    try:
+        encoded = base64.b64encode(Path(path).read_bytes()).decode("ascii")
+    except OSError:
+        return html.escape(str(path))
+    mime_type = mimetypes.guess_type(str(path))[0] or "image/png"
+    return f"data:{mime_type};base64,{encoded}"
+
+
+def read_csv_fast(source: Union[str, Path, io.BytesIO], **options: Any) -> pd.DataFrame:
+    """
+    Read a CSV with PyArrow's multi-threaded parser, falling back to pandas' C engine.
+    
+    The fallback covers a missing pyarrow and files the stricter Arrow parser
+    rejects but the C engine accepts (e.g. rows with missing trailing fields).
+    
+    Args:
+        source: Path or seekable binary buffer holding the CSV
+        **options: Extra read_csv options for the Arrow path (e.g. dtype_backend)
+        
+    Returns:
+        DataFrame containing the CSV data
+    """
+    try:
+        return pd.read_csv(source, engine="pyarrow", **options)
+    except (ImportError, ValueError):
+        # pandas reports Arrow parse failures as ParserError, a ValueError subclass
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return pd.read_csv(source)
+
+
+def _sorted_by_date(df: pd.DataFrame, date_column: str, value_column: str) -> Tuple[pd.Series, pd.Series]:
+    """
+    Get the date and value columns ordered by date, with the dates parsed.
+    
+    Dates that are already sorted datetime64 are returned as-is, without a
+    copy or a sort; otherwise only the two columns are copied.
+    
+    Args:
+        df: DataFrame containing the data
+        date_column: Name of the date column
+        value_column: Name of the value column
+        
+    Returns:
+        Tuple of (dates, values) Series sorted by date
+    """
+    dates = df[date_column]
+    if pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing:
+        return dates, df[value_column]
+    
+    subset = df[[date_column, value_column]].copy()
+    if not pd.api.types.is_datetime64_any_dtype(subset[date_column]):
+        subset[date_column] = pd.to_datetime(subset[date_column])
+    subset = subset.sort_values(date_column, kind="mergesort")
+    return subset[date_column], subset[value_column]
 
 
 class DataIngestionTool:
@@ -56,13 +314,15 @@ class DataIngestionTool:
         
         # Load based on file extension
         if path.suffix == '.csv':
-            df = pd.read_csv(file_path)
+            # Columns still come back as NumPy dtypes for the analysis kernels
+            df = read_csv_fast(file_path)
         elif path.suffix == '.json':
             df = pd.read_json(file_path)
         elif path.suffix in ['.xlsx', '.xls']:
             df = pd.read_excel(file_path)
         
-        observability.logger.info(
+        observability.emit(
+            "info",
             "data_loaded",
             file_path=file_path,
             rows=len(df),
@@ -82,59 +342,108 @@ class DataIngestionTool:
         Returns:
             Dictionary containing summary statistics
         """
-        # Convert missing values to dict with int conversion
-        missing_values = {}
-        for col, val in df.isnull().sum().items():
-            missing_values[col] = int(val)
+        numeric_df = df.select_dtypes(include=[np.number])
         
         summary = {
             "shape": {"rows": int(df.shape[0]), "columns": int(df.shape[1])},
             "columns": list(df.columns),
             "dtypes": df.dtypes.astype(str).to_dict(),
-            "missing_values": missing_values,
+            "missing_values": df.isnull().sum().astype(int).to_dict(),
             "memory_usage": f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB",
-            "numeric_summary": df.describe().to_dict() if len(df.select_dtypes(include=[np.number]).columns) > 0 else {}
+            "numeric_summary": numeric_df.describe().to_dict() if len(numeric_df.columns) > 0 else {}
         }
         
         return summary
 
 
+def _frame_cached(method):
+    """
+    Memoize a StatisticalAnalysisTool method per DataFrame object.
+    
+    Results are keyed on the frame's identity, shape and columns plus the bound
+    call arguments (positional or keyword), and are dropped when the frame is
+    garbage collected, so ids are never reused for a stale entry. Frames are
+    assumed not to be modified in place between calls. Each caller gets its own
+    deep copy, so mutating a result never changes what later calls return.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, df: pd.DataFrame, *args, **kwargs):
+        bound = signature.bind(self, df, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(
+            (name, tuple(value) if isinstance(value, (list, tuple, pd.Index)) else value)
+            for name, value in list(bound.arguments.items())[2:]
+        )
+        key = (method.__name__, df.shape, tuple(df.columns), arguments)
+        try:
+            hash(key)
+        except TypeError:
+            # Arguments that cannot be keyed are computed without the cache
+            return method(self, df, *args, **kwargs)
+        
+        frame_id = id(df)
+        with self._cache_lock:
+            results = self._frame_results.get(frame_id)
+            if results is not None and key in results:
+                return copy.deepcopy(results[key])
+        
+        result = method(self, df, *args, **kwargs)
+        with self._cache_lock:
+            if frame_id not in self._frame_results:
+                self._frame_results[frame_id] = {}
+                weakref.finalize(df, self._frame_results.pop, frame_id, None)
+            self._frame_results[frame_id][key] = copy.deepcopy(result)
+        return result
+    
+    return wrapper
+
+
 class StatisticalAnalysisTool:
     """Tool for performing statistical analysis on datasets."""
     
     def __init__(self):
         """Initialize the statistical analysis tool."""
         self.observability = observability
+        # Correlation and outlier results per live DataFrame (see _frame_cached)
+        self._frame_results: Dict[int, Dict[tuple, Any]] = {}
+        self._cache_lock = threading.Lock()
     
     @trace_execution
-    def calculate_correlations(self, df: pd.DataFrame) -> Dict[str, Any]:
+    @_frame_cached
+    def calculate_correlations(self, df: pd.DataFrame,
+                               numeric_cols: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Calculate correlation matrix for numeric columns.
         
         Args:
             df: DataFrame to analyze
+            numeric_cols: Numeric column names, if the caller already has them
             
         Returns:
             Dictionary with correlation matrix and strong correlations
         """
-        numeric_df = df.select_dtypes(include=[np.number])
+        columns, block = float32_block(df, numeric_cols)
         
-        if numeric_df.empty:
+        if not columns:
             return {"error": "No numeric columns found for correlation analysis"}
         
-        corr_matrix = numeric_df.corr()
-        
-        # Find strong correlations (|r| > 0.7, excluding diagonal)
-        strong_corr = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) > 0.7:
-                    strong_corr.append({
-                        "variable_1": corr_matrix.columns[i],
-                        "variable_2": corr_matrix.columns[j],
-                        "correlation": float(corr_value)
-                    })
+        corr = correlation_matrix(block)
+        corr_matrix = pd.DataFrame(corr, index=columns, columns=columns)
+        
+        # Find strong correlations (|r| > 0.7) in the upper triangle, excluding diagonal
+        rows, cols = np.triu_indices(len(columns), k=1)
+        values = corr[rows, cols]
+        strong = np.abs(values) > 0.7
+        strong_corr = [
+            {
+                "variable_1": columns[i],
+                "variable_2": columns[j],
+                "correlation": float(value)
+            }
+            for i, j, value in zip(rows[strong].tolist(), cols[strong].tolist(), values[strong].tolist())
+        ]
         
         return {
             "correlation_matrix": corr_matrix.to_dict(),
@@ -142,6 +451,7 @@ class StatisticalAnalysisTool:
         }
     
     @trace_execution
+    @_frame_cached
     def detect_outliers(self, df: pd.DataFrame, column: str) -> Dict[str, Any]:
         """
         Detect outliers in a numeric column using IQR method.
@@ -159,31 +469,55 @@ class StatisticalAnalysisTool:
         if not np.issubdtype(df[column].dtype, np.number):
             return {"error": f"Column '{column}' is not numeric"}
         
-        Q1 = df[column].quantile(0.25)
-        Q3 = df[column].quantile(0.75)
-        IQR = Q3 - Q1
+        # One float64 column view; the filtered frame is never built
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._outlier_summaries([column], iqr_outlier_stats(values[:, None]), len(df))[0]
+    
+    @trace_execution
+    @_frame_cached
+    def detect_outliers_vectorized(self, df: pd.DataFrame, columns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Detect outliers in several numeric columns at once using the IQR method.
         
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
+        Produces the same per-column dictionaries as detect_outliers, but the
+        quartiles and outlier counts come from one pass over a NumPy block.
         
-        outliers = df[(df[column] < lower_bound) | (df[column] > upper_bound)]
+        Args:
+            df: DataFrame containing the data
+            columns: Names of the numeric columns to analyze
+            
+        Returns:
+            List of outlier information dictionaries, one per column
+        """
+        if not columns:
+            return []
         
-        return {
-            "column": column,
-            "total_values": int(len(df)),
-            "outlier_count": int(len(outliers)),
-            "outlier_percentage": float(len(outliers) / len(df) * 100),
-            "bounds": {
-                "lower": float(lower_bound),
-                "upper": float(upper_bound)
-            },
-            "quartiles": {
-                "Q1": float(Q1),
-                "Q2": float(df[column].median()),
-                "Q3": float(Q3),
-                "IQR": float(IQR)
+        _, block = float32_block(df, columns)
+        return self._outlier_summaries(columns, iqr_outlier_stats(block), len(df))
+    
+    @staticmethod
+    def _outlier_summaries(columns: List[str], stats: Dict[str, np.ndarray],
+                           total: int) -> List[Dict[str, Any]]:
+        """Build the per-column outlier dictionaries from iqr_outlier_stats output."""
+        return [
+            {
+                "column": column,
+                "total_values": int(total),
+                "outlier_count": int(stats["outlier_count"][i]),
+                "outlier_percentage": float(stats["outlier_count"][i] / total * 100) if total else 0.0,
+                "bounds": {
+                    "lower": float(stats["lower"][i]),
+                    "upper": float(stats["upper"][i])
+                },
+                "quartiles": {
+                    "Q1": float(stats["q1"][i]),
+                    "Q2": float(stats["median"][i]),
+                    "Q3": float(stats["q3"][i]),
+                    "IQR": float(stats["iqr"][i])
+                }
             }
-        }
+            for i, column in enumerate(columns)
+        ]
     
     @trace_execution
     def trend_analysis(self, df: pd.DataFrame, date_column: str, value_column: str) -> Dict[str, Any]:
@@ -198,22 +532,22 @@ class StatisticalAnalysisTool:
         Returns:
             Dictionary with trend analysis results
         """
+        # Deferred so importing tools does not pay for scipy
+        from scipy import stats
+        
         try:
             # Ensure date column is datetime
-            df_copy = df.copy()
-            df_copy[date_column] = pd.to_datetime(df_copy[date_column])
-            df_copy = df_copy.sort_values(date_column)
+            _, series = _sorted_by_date(df, date_column, value_column)
             
             # Calculate basic trend statistics
-            values = df_copy[value_column].values
-            x = np.arange(len(values))
+            values = series.to_numpy(dtype=np.float64)
+            if values.size < 2:
+                return {"error": "Trend analysis needs at least two data points"}
             
             # Linear regression for trend
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, values)
-            
-            # Calculate moving averages
-            ma_7 = df_copy[value_column].rolling(window=min(7, len(df_copy))).mean()
-            ma_30 = df_copy[value_column].rolling(window=min(30, len(df_copy))).mean()
+            slope, intercept, r_value, p_value, std_err = stats.linregress(
+                np.arange(values.size, dtype=np.float64), values
+            )
             
             trend_direction = "increasing" if slope > 0 else "decreasing" if slope < 0 else "flat"
             
@@ -222,10 +556,10 @@ class StatisticalAnalysisTool:
                 "slope": float(slope),
                 "r_squared": float(r_value ** 2),
                 "p_value": float(p_value),
-                "mean": float(df_copy[value_column].mean()),
-                "std": float(df_copy[value_column].std()),
-                "min": float(df_copy[value_column].min()),
-                "max": float(df_copy[value_column].max()),
+                "mean": float(series.mean()),
+                "std": float(series.std()),
+                "min": float(series.min()),
+                "max": float(series.max()),
                 "growth_rate": float((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else None
             }
         except Exception as e:
@@ -235,10 +569,14 @@ class StatisticalAnalysisTool:
 class VisualizationTool:
     """Tool for creating data visualizations."""
     
+    # Longer time series are downsampled with LTTB to this many points before plotting
+    TIME_SERIES_MAX_POINTS = 3000
+    TIME_SERIES_TARGET_POINTS = 2000
+    
     def __init__(self):
         """Initialize the visualization tool."""
         self.observability = observability
-        Config.OUTPUT_DIR.mkdir(exist_ok=True)
+        _ensure_output_dirs()
     
     @trace_execution
     def create_correlation_heatmap(self, df: pd.DataFrame, output_path: Optional[str] = None) -> str:
@@ -261,20 +599,35 @@ class VisualizationTool:
         corr = numeric_df.corr()
         
         # Create heatmap
-        plt.figure(figsize=(12, 10))
-        sns.heatmap(corr, annot=True, cmap='coolwarm', center=0, 
-                    square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-        plt.title('Correlation Heatmap', fontsize=16, fontweight='bold')
-        plt.tight_layout()
+        columns = list(corr.columns)
+        values = corr.to_numpy()
+        n = len(columns)
+        fig = _new_figure(figsize=(12, 10), dpi=Config.HEATMAP_DPI)
+        ax = fig.subplots()
+        image = ax.imshow(values, cmap='coolwarm', vmin=-1, vmax=1)
+        ax.set_xticks(range(n))
+        ax.set_yticks(range(n))
+        ax.set_xticklabels(columns, rotation=45, ha='right')
+        ax.set_yticklabels(columns)
+        
+        # Label every cell, as seaborn's annot=True did, unless a minimum |r| is configured
+        rows, cols = np.nonzero(np.abs(values) >= Config.HEATMAP_ANNOTATION_MIN)
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            value = values[i, j]
+            ax.text(j, i, f"{value:.2f}", ha='center', va='center', fontsize=8,
+                    color='white' if abs(value) > 0.6 else 'black')
+        
+        fig.colorbar(image, shrink=0.8)
+        ax.set_title('Correlation Heatmap', fontsize=16, fontweight='bold')
+        fig.tight_layout()
         
         # Save figure
         if output_path is None:
-            output_path = Config.OUTPUT_DIR / f"correlation_heatmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            output_path = Config.OUTPUT_DIR / f"correlation_heatmap_{_file_stamp()}.png"
         else:
             output_path = Path(output_path)
         
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        _save_png(fig, output_path)
         
         return str(output_path)
     
@@ -294,7 +647,8 @@ class VisualizationTool:
         if column not in df.columns:
             raise ValueError(f"Column '{column}' not found")
         
-        fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+        fig = _new_figure(figsize=(15, 6), dpi=Config.REPORT_DPI)
+        axes = fig.subplots(1, 2)
         
         # Histogram with KDE
         axes[0].hist(df[column].dropna(), bins=30, edgecolor='black', alpha=0.7)
@@ -309,16 +663,15 @@ class VisualizationTool:
         axes[1].set_title(f'Box Plot of {column}', fontsize=14, fontweight='bold')
         axes[1].grid(alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         if output_path is None:
-            output_path = Config.OUTPUT_DIR / f"distribution_{column}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            output_path = Config.OUTPUT_DIR / f"distribution_{column}_{_file_stamp()}.png"
         else:
             output_path = Path(output_path)
         
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        _save_png(fig, output_path)
         
         return str(output_path)
     
@@ -337,38 +690,76 @@ class VisualizationTool:
         Returns:
             Path to the saved visualization
         """
-        df_copy = df.copy()
-        df_copy[date_column] = pd.to_datetime(df_copy[date_column])
-        df_copy = df_copy.sort_values(date_column)
-        
-        plt.figure(figsize=(14, 7))
-        plt.plot(df_copy[date_column], df_copy[value_column], linewidth=2, marker='o', markersize=4)
-        plt.xlabel(date_column, fontsize=12)
-        plt.ylabel(value_column, fontsize=12)
-        plt.title(f'{value_column} Over Time', fontsize=14, fontweight='bold')
-        plt.grid(alpha=0.3)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        dates, series = _sorted_by_date(df, date_column, value_column)
+        
+        x, y = dates.to_numpy(), series.to_numpy()
+        marker_style = {"marker": 'o', "markersize": 4}
+        if len(x) > self.TIME_SERIES_MAX_POINTS:
+            # Plot a shape-preserving subset of the series as a plain line
+            instants = dates.to_numpy(dtype="datetime64[ns]")
+            y = y.astype(np.float64)
+            keep = ~np.isnat(instants) & np.isfinite(y)
+            x, y, instants = x[keep], y[keep], instants[keep]
+            indices = lttb_indices(instants.astype(np.int64).astype(np.float64), y,
+                                   self.TIME_SERIES_TARGET_POINTS)
+            x, y = x[indices], y[indices]
+            marker_style = {}
+        
+        fig = _new_figure(figsize=(14, 7), dpi=Config.REPORT_DPI)
+        ax = fig.add_subplot()
+        ax.plot(x, y, linewidth=2, **marker_style)
+        ax.set_xlabel(date_column, fontsize=12)
+        ax.set_ylabel(value_column, fontsize=12)
+        ax.set_title(f'{value_column} Over Time', fontsize=14, fontweight='bold')
+        ax.grid(alpha=0.3)
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
         # Save figure
         if output_path is None:
-            output_path = Config.OUTPUT_DIR / f"timeseries_{value_column}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            output_path = Config.OUTPUT_DIR / f"timeseries_{value_column}_{_file_stamp()}.png"
         else:
             output_path = Path(output_path)
         
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        _save_png(fig, output_path)
         
         return str(output_path)
 
 
+def render_correlation_heatmap(numeric_df: pd.DataFrame) -> str:
+    """
+    Render a correlation heatmap; module-level so it can run in a worker process.
+    
+    Args:
+        numeric_df: Numeric columns to correlate
+        
+    Returns:
+        Path to the saved visualization
+    """
+    return VisualizationTool().create_correlation_heatmap(numeric_df)
+
+
+def render_distribution_plot(column_df: pd.DataFrame, column: str) -> str:
+    """
+    Render a distribution plot; module-level so it can run in a worker process.
+    
+    Args:
+        column_df: DataFrame holding the column to plot
+        column: Column name to visualize
+        
+    Returns:
+        Path to the saved visualization
+    """
+    return VisualizationTool().create_distribution_plot(column_df, column)
+
+
 class ReportGenerationTool:
     """Tool for generating comprehensive analysis reports."""
     
     def __init__(self):
         """Initialize the report generation tool."""
         self.observability = observability
-        Config.REPORTS_DIR.mkdir(exist_ok=True)
+        _ensure_output_dirs()
     
     @trace_execution
     def generate_html_report(self, 
@@ -402,136 +793,31 @@ class ReportGenerationTool:
         visualizations = [v for v in visualizations if v is not None]
         insights = [i for i in insights if i is not None and str(i).strip()]
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Business Intelligence Analysis Report</title>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    line-height: 1.6;
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-bottom: 30px;
-                }}
-                .header h1 {{
-                    margin: 0;
-                    font-size: 2.5em;
-                }}
-                .section {{
-                    background: white;
-                    padding: 25px;
-                    margin-bottom: 20px;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                .section h2 {{
-                    color: #667eea;
-                    border-bottom: 2px solid #667eea;
-                    padding-bottom: 10px;
-                }}
-                .insight {{
-                    background: #f0f4ff;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-left: 4px solid #667eea;
-                    border-radius: 4px;
-                }}
-                .metric {{
-                    display: inline-block;
-                    background: #e8f4f8;
-                    padding: 10px 20px;
-                    margin: 5px;
-                    border-radius: 5px;
-                }}
-                .visualization {{
-                    max-width: 100%;
-                    height: auto;
-                    margin: 15px 0;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                }}
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 15px 0;
-                }}
-                th, td {{
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #ddd;
-                }}
-                th {{
-                    background-color: #667eea;
-                    color: white;
-                }}
-                tr:hover {{
-                    background-color: #f5f5f5;
-                }}
-                .footer {{
-                    text-align: center;
-                    padding: 20px;
-                    color: #666;
-                    font-size: 0.9em;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📊 Business Intelligence Analysis Report</h1>
-                <p>Generated: {timestamp}</p>
-            </div>
-            
-            <div class="section">
-                <h2>📈 Data Summary</h2>
-                <div class="metric"><strong>Rows:</strong> {data_summary.get('shape', {}).get('rows', 'N/A')}</div>
-                <div class="metric"><strong>Columns:</strong> {data_summary.get('shape', {}).get('columns', 'N/A')}</div>
-                <div class="metric"><strong>Memory:</strong> {data_summary.get('memory_usage', 'N/A')}</div>
-            </div>
-            
-            <div class="section">
-                <h2>💡 Key Insights</h2>
-                {"".join([f'<div class="insight">• {insight}</div>' for insight in (insights if isinstance(insights, list) else [])])}
-            </div>
-            
-            <div class="section">
-                <h2>📊 Visualizations</h2>
-                {"".join([f'<img src="{viz}" class="visualization" alt="Visualization">' for viz in (visualizations if isinstance(visualizations, list) else [])])}
-            </div>
-            
-            <div class="section">
-                <h2>🔍 Detailed Analysis</h2>
-                <pre style="background: #f5f5f5; padding: 15px; border-radius: 5px; overflow-x: auto;">
-{json.dumps(analysis_results, indent=2)}
-                </pre>
-            </div>
-            
-            <div class="footer">
-                <p>Generated by BI Intelligence Agent System | Powered by Google Gemini</p>
-            </div>
-        </body>
-        </html>
-        """
-        
         # Save report
         if output_path is None:
-            output_path = Config.REPORTS_DIR / f"bi_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            output_path = Config.REPORTS_DIR / f"bi_report_{_file_stamp()}.html"
         else:
             output_path = Path(output_path)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream each section to disk instead of building the page in memory
+        shape = data_summary.get('shape', {})
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(_REPORT_HEADER.substitute(
+                timestamp=timestamp,
+                rows=shape.get('rows', 'N/A'),
+                columns=shape.get('columns', 'N/A'),
+                memory=data_summary.get('memory_usage', 'N/A')
+            ))
+            f.writelines(f'<div class="insight">• {html.escape(str(insight))}</div>' for insight in insights)
+            f.write(_REPORT_VISUALIZATIONS)
+            # Embed the images so the report still renders after it is moved;
+            # the file reads and encoding overlap across a small thread pool
+            with ThreadPoolExecutor(max_workers=min(8, len(visualizations) or 1)) as pool:
+                f.writelines(f'<img src="{src}" class="visualization" alt="Visualization">'
+                             for src in pool.map(_image_src, visualizations))
+            f.write(_REPORT_ANALYSIS)
+            f.write(orjson.dumps(analysis_results, option=_REPORT_JSON_OPTIONS).decode())
+            f.write(_REPORT_FOOTER)
         
         return str(output_path)
 